@@ -6,6 +6,7 @@ import re
 import sqlite3
 import time
 from collections.abc import Iterable
+from contextlib import nullcontext
 from pathlib import Path
 from typing import Any
 
@@ -47,7 +48,8 @@ CREATE TABLE IF NOT EXISTS tracks (
 );
 
 CREATE VIRTUAL TABLE IF NOT EXISTS tracks_fts USING fts5(
-    title, artist, album, genre, path
+    title, artist, album, genre, path,
+    tokenize='unicode61 remove_diacritics 2'
 );
 
 CREATE TABLE IF NOT EXISTS fingerprint_cache (
@@ -77,16 +79,44 @@ MIGRATION_COLUMNS: tuple[tuple[str, str], ...] = (
     ("cover_art_url", "TEXT"),
 )
 
+# ``PRAGMA user_version`` from which ``tracks_fts`` rowids are known to match ``tracks.id``.
+FTS_ROWID_SCHEMA_VERSION = 1
+
 
 _FTS_TOKEN_RE = re.compile(r"\w+", re.UNICODE)
 
 
-def connect(db_path: Path) -> sqlite3.Connection:
-    con = sqlite3.connect(str(db_path))
+# Per-connection settings: none of these persist in the database file.
+CONNECTION_PRAGMAS: tuple[str, ...] = (
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",
+    "PRAGMA cache_size=-65536",
+)
+
+
+def _configure(con: sqlite3.Connection) -> sqlite3.Connection:
     con.row_factory = sqlite3.Row
+    for pragma in CONNECTION_PRAGMAS:
+        con.execute(pragma)
+    return con
+
+
+def connect(db_path: Path) -> sqlite3.Connection:
+    con = _configure(sqlite3.connect(str(db_path)))
+    # WAL lets worker readers run alongside this writer; NORMAL sync is safe under WAL.
+    con.execute("PRAGMA journal_mode=WAL")
+    con.execute("PRAGMA synchronous=NORMAL")
+    con.execute("PRAGMA foreign_keys=ON")
     return con
 
 
+def connect_readonly(db_path: Path) -> sqlite3.Connection:
+    """Open *db_path* in read-only mode, e.g. for queries run on worker threads."""
+
+    uri = f"{db_path.expanduser().resolve().as_uri()}?mode=ro"
+    return _configure(sqlite3.connect(uri, uri=True, check_same_thread=False))
+
+
 def _table_has_column(con: sqlite3.Connection, table: str, column: str) -> bool:
     cur = con.execute(f"PRAGMA table_info({table})")
     return any(r["name"] == column for r in cur.fetchall())
@@ -104,12 +134,57 @@ def _migrate_columns(con: sqlite3.Connection):
                 con.execute(f"ALTER TABLE tracks ADD COLUMN {col} {ctype}")
 
 
+def _migrate_fts_tokenizer(con: sqlite3.Connection):
+    """Recreate ``tracks_fts`` when it predates the diacritic-folding tokenizer.
+
+    The table is dropped and created again from ``BASE_SCHEMA``; resetting
+    ``user_version`` makes :func:`_sync_fts_rowids` refill it right afterwards.
+    """
+
+    row = con.execute("SELECT sql FROM sqlite_master WHERE name='tracks_fts'").fetchone()
+    if row is None or "remove_diacritics 2" in (row["sql"] or ""):
+        return
+    con.execute("PRAGMA user_version = 0")
+    with con:
+        con.execute("DROP TABLE tracks_fts")
+    _run_schema(con)
+
+
+def _sync_fts_rowids(con: sqlite3.Connection):
+    """Make every ``tracks_fts`` rowid match its ``tracks.id``.
+
+    Older databases inserted FTS rows with free-running rowids; searches join on
+    ``rowid`` so the index is rebuilt once when the two tables drift apart. The
+    check runs until ``user_version`` reaches :data:`FTS_ROWID_SCHEMA_VERSION`, so
+    later launches skip the full-table counts.
+    """
+
+    if con.execute("PRAGMA user_version").fetchone()[0] >= FTS_ROWID_SCHEMA_VERSION:
+        return
+    fts_count = con.execute("SELECT COUNT(*) FROM tracks_fts").fetchone()[0]
+    matched = con.execute(
+        "SELECT COUNT(*) FROM tracks_fts JOIN tracks ON tracks.id = tracks_fts.rowid "
+        "WHERE tracks.path = tracks_fts.path"
+    ).fetchone()[0]
+    track_count = con.execute("SELECT COUNT(*) FROM tracks").fetchone()[0]
+    with con:
+        if not fts_count == matched == track_count:
+            con.execute("DELETE FROM tracks_fts")
+            con.execute(
+                "INSERT INTO tracks_fts (rowid,title,artist,album,genre,path) "
+                "SELECT id,title,artist,album,genre,path FROM tracks"
+            )
+        con.execute(f"PRAGMA user_version = {FTS_ROWID_SCHEMA_VERSION}")
+
+
 def init_db(db_dir: Path) -> Path:
     db_dir.mkdir(parents=True, exist_ok=True)
     db_path = db_dir / DB_FILENAME
     con = connect(db_path)
     _run_schema(con)
     _migrate_columns(con)
+    _migrate_fts_tokenizer(con)
+    _sync_fts_rowids(con)
     return db_path
 
 
@@ -117,17 +192,24 @@ def fts_query_from_text(text: str) -> str | None:
     """Return an FTS5 query string that performs prefix matches for *text*.
 
     The returned query searches across all indexed columns and expands each
-    alphanumeric token into a prefix match by appending ``*``. ``None`` is
+    alphanumeric token into a quoted prefix match (``"token"*``). ``None`` is
     returned when no meaningful tokens can be extracted.
     """
 
     tokens = _FTS_TOKEN_RE.findall(text)
     if not tokens:
         return None
-    return " ".join(f"{token}*" for token in tokens)
+    # Quoting keeps words such as AND/OR/NOT/NEAR from being parsed as operators.
+    return " ".join(f'"{token}"*' for token in tokens)
+
 
+def upsert_track(con: sqlite3.Connection, data: dict[str, Any], *, commit: bool = True) -> int:
+    """Insert or update the track at ``data["path"]`` and its full-text row.
+
+    With ``commit=False`` the statements join the caller's open transaction, so bulk
+    writers such as :func:`~songsearch.core.scanner.scan_path` can commit in batches.
+    """
 
-def upsert_track(con: sqlite3.Connection, data: dict[str, Any]) -> int:
     cur = con.execute("PRAGMA table_info(tracks)")
     cols = [r["name"] for r in cur.fetchall()]
     fields = [
@@ -163,7 +245,7 @@ def upsert_track(con: sqlite3.Connection, data: dict[str, Any]) -> int:
     placeholders = ",".join("?" for _ in fields)
     values = [data.get(k) for k in fields]
 
-    with con:
+    with con if commit else nullcontext():
         con.execute(
             f"""
             INSERT INTO tracks ({",".join(fields)})
@@ -174,10 +256,11 @@ def upsert_track(con: sqlite3.Connection, data: dict[str, Any]) -> int:
             values,
         )
         rowid = con.execute("SELECT id FROM tracks WHERE path=?", (data["path"],)).fetchone()["id"]
-        con.execute("DELETE FROM tracks_fts WHERE path=?", (data["path"],))
+        con.execute("DELETE FROM tracks_fts WHERE rowid=?", (rowid,))
         con.execute(
-            "INSERT INTO tracks_fts (title,artist,album,genre,path) VALUES (?,?,?,?,?)",
+            "INSERT INTO tracks_fts (rowid,title,artist,album,genre,path) VALUES (?,?,?,?,?,?)",
             (
+                rowid,
                 data.get("title"),
                 data.get("artist"),
                 data.get("album"),
@@ -188,53 +271,120 @@ def upsert_track(con: sqlite3.Connection, data: dict[str, Any]) -> int:
     return rowid
 
 
-def update_fields(con: sqlite3.Connection, path: str, updates: dict[str, Any]):
+def update_fields(
+    con: sqlite3.Connection, path: str, updates: dict[str, Any], *, commit: bool = True
+):
     if not updates:
         return
     old_path = path
     new_path = updates.get("path", old_path)
     cols = list(updates.keys())
     vals = [updates[c] for c in cols]
-    with con:
+    with con if commit else nullcontext():
         con.execute(
             f"UPDATE tracks SET {', '.join(c + '=?' for c in cols)} WHERE path=?", (*vals, old_path)
         )
         r = con.execute(
-            "SELECT title,artist,album,genre,path FROM tracks WHERE path=?", (new_path,)
+            "SELECT id,title,artist,album,genre,path FROM tracks WHERE path=?", (new_path,)
         ).fetchone()
         if r:
-            con.execute("DELETE FROM tracks_fts WHERE path=?", (old_path,))
+            con.execute("DELETE FROM tracks_fts WHERE rowid=?", (r["id"],))
             con.execute(
-                "INSERT INTO tracks_fts (title,artist,album,genre,path) VALUES (?,?,?,?,?)",
-                (r["title"], r["artist"], r["album"], r["genre"], r["path"]),
+                "INSERT INTO tracks_fts (rowid,title,artist,album,genre,path) "
+                "VALUES (?,?,?,?,?,?)",
+                (r["id"], r["title"], r["artist"], r["album"], r["genre"], r["path"]),
             )
 
 
+def optimize_fts(con: sqlite3.Connection) -> None:
+    """Merge the ``tracks_fts`` index segments left behind by many small writes."""
+
+    with con:
+        con.execute("INSERT INTO tracks_fts(tracks_fts) VALUES('optimize')")
+
+
 def get_by_path(con: sqlite3.Connection, path: str) -> sqlite3.Row | None:
     """Return the track row for *path* or ``None`` if it doesn't exist."""
 
     return con.execute("SELECT * FROM tracks WHERE path=?", (path,)).fetchone()
 
 
-def query_tracks(
-    con: sqlite3.Connection,
-    where: str = "",
-    params: Iterable[Any] = (),
-    fts_query: str | None = None,
-) -> list[sqlite3.Row]:
-    sql = "SELECT tracks.* FROM tracks"
+def _tracks_filter(
+    where: str, params: Iterable[Any], fts_query: str | None
+) -> tuple[str, list[Any]]:
+    sql = " FROM tracks"
     sql_params = list(params)
     conditions = []
     if fts_query:
-        sql += " JOIN tracks_fts ON tracks.path = tracks_fts.path"
+        # Join on rowid (== tracks.id) and MATCH on the table name so SQLite drives the
+        # search from the FTS index instead of scanning ``tracks``.
+        sql += " JOIN tracks_fts ON tracks_fts.rowid = tracks.id"
         conditions.append("tracks_fts MATCH ?")
         sql_params.insert(0, fts_query)
     if where:
         conditions.append(f"({where})")
     if conditions:
         sql += " WHERE " + " AND ".join(conditions)
-    sql += " ORDER BY artist, album, title"
-    return list(con.execute(sql, tuple(sql_params)).fetchall())
+    return sql, sql_params
+
+
+def _tracks_select(
+    where: str, params: Iterable[Any], fts_query: str | None, limit: int | None
+) -> tuple[str, list[Any]]:
+    sql, sql_params = _tracks_filter(where, params, fts_query)
+    sql = "SELECT tracks.*" + sql + " ORDER BY artist, album, title"
+    if limit is not None:
+        sql += " LIMIT ?"
+        sql_params.append(limit)
+    return sql, sql_params
+
+
+def query_tracks(
+    con: sqlite3.Connection,
+    where: str = "",
+    params: Iterable[Any] = (),
+    fts_query: str | None = None,
+    limit: int | None = None,
+) -> list[sqlite3.Row]:
+    sql, sql_params = _tracks_select(where, params, fts_query, limit)
+    return con.execute(sql, tuple(sql_params)).fetchall()
+
+
+def explain_tracks_query(
+    con: sqlite3.Connection,
+    fts_query: str | None = None,
+    limit: int | None = None,
+) -> list[str]:
+    """Return the ``EXPLAIN QUERY PLAN`` steps of the matching :func:`query_tracks` call."""
+
+    sql, sql_params = _tracks_select("", (), fts_query, limit)
+    return [row[3] for row in con.execute("EXPLAIN QUERY PLAN " + sql, tuple(sql_params))]
+
+
+# EXPLAIN QUERY PLAN wording varies by SQLite version: before 3.36 steps read
+# "SCAN TABLE tracks" / "SCAN TABLE tracks_fts VIRTUAL TABLE INDEX ...".
+_FULL_SCAN_RE = re.compile(r"SCAN (TABLE )?tracks\b(?! USING)")
+
+
+def fts_plan_uses_index(plan: Iterable[str]) -> bool:
+    """Return whether a full-text *plan* is driven by the FTS index, not a table scan."""
+
+    steps = list(plan)
+    return any("tracks_fts" in step and "VIRTUAL TABLE" in step for step in steps) and not any(
+        _FULL_SCAN_RE.match(step) for step in steps
+    )
+
+
+def count_tracks(
+    con: sqlite3.Connection,
+    where: str = "",
+    params: Iterable[Any] = (),
+    fts_query: str | None = None,
+) -> int:
+    """Return how many rows :func:`query_tracks` would yield without a ``limit``."""
+
+    sql, sql_params = _tracks_filter(where, params, fts_query)
+    return int(con.execute("SELECT COUNT(*)" + sql, tuple(sql_params)).fetchone()[0])
 
 
 def _fingerprint_key(path: str) -> str:
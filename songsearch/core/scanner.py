@@ -1,8 +1,10 @@
 from __future__ import annotations
 
 import logging
+import time
 from collections.abc import Callable
 from pathlib import Path
+from typing import Any
 
 from mutagen import File as MutagenFile
 
@@ -11,6 +13,14 @@ from .utils import is_audio
 
 logger = logging.getLogger(__name__)
 
+# Files written per transaction; committing after every file made large scans fsync-bound.
+SCAN_BATCH_SIZE = 500
+# A slow volume still flushes what it has read at least this often (seconds).
+SCAN_BATCH_SECONDS = 2.0
+
+# A pending write: (path, fields for update_fields) or (None, row for upsert_track).
+_PendingWrite = tuple[str | None, dict[str, Any]]
+
 
 TAG_KEY_ALIASES = {
     "title": ("title", "TITLE", "TIT2", "\u00a9nam"),
@@ -27,55 +37,116 @@ def scan_path(
     con,
     root: Path,
     should_interrupt: Callable[[], bool] | None = None,
-):
+    batch_size: int = SCAN_BATCH_SIZE,
+) -> int:
+    """Index the audio files under *root* and return how many tracks were written.
+
+    Tags are read with no transaction open; the resulting writes are flushed in one
+    short transaction every *batch_size* files or :data:`SCAN_BATCH_SECONDS`, and
+    once more when the walk ends, including when it is interrupted. Other writers
+    (organizer, enrichment) therefore only wait for a flush, never for tag parsing.
+    """
+
     root = root.expanduser().resolve()
-    for p in root.rglob("*"):
-        if should_interrupt is not None and should_interrupt():
-            logger.info("[scan] interrupted while visiting %s", p)
-            break
-        if not p.is_file() or not is_audio(p):
-            continue
-        try:
-            stat = p.stat()
-            existing = get_by_path(con, str(p))
+    written = 0
+    pending: list[_PendingWrite] = []
+    batch_started = time.monotonic()
+    try:
+        for p in root.rglob("*"):
+            if should_interrupt is not None and should_interrupt():
+                logger.info("[scan] interrupted while visiting %s", p)
+                break
+            write = _read_file(con, p)
+            if write is None:
+                continue
+            if not pending:
+                batch_started = time.monotonic()
+            pending.append(write)
             if (
-                existing
-                and existing["mtime"] == stat.st_mtime
-                and existing["file_size"] == stat.st_size
+                len(pending) >= batch_size
+                or time.monotonic() - batch_started >= SCAN_BATCH_SECONDS
             ):
-                updates = {}
-                if existing["missing"]:
-                    updates["missing"] = 0
-                if updates:
-                    update_fields(con, str(p), updates)
-                continue
-            info = {"path": str(p), "mtime": stat.st_mtime, "file_size": stat.st_size, "missing": 0}
-            audio = MutagenFile(str(p))
-            if audio:
-                tags = getattr(audio, "tags", None)
-                if tags:
-                    info["title"] = _first(tags, TAG_KEY_ALIASES["title"])
-                    info["artist"] = _first(tags, TAG_KEY_ALIASES["artist"])
-                    info["album"] = _first(tags, TAG_KEY_ALIASES["album"])
-                    info["genre"] = _first(tags, TAG_KEY_ALIASES["genre"])
-                    info["year"] = _int_or_none(
-                        _first(tags, TAG_KEY_ALIASES["date"])
-                        or _first(tags, TAG_KEY_ALIASES["year"])
-                    )
-                    info["track_no"] = _int_or_none(_first(tags, TAG_KEY_ALIASES["tracknumber"]))
-                info["format"] = p.suffix.lower().lstrip(".")
-                audio_info = getattr(audio, "info", None)
-                if audio_info and getattr(audio_info, "length", None) is not None:
-                    info["duration"] = float(audio_info.length)
-                if audio_info and getattr(audio_info, "bitrate", None) is not None:
-                    info["bitrate"] = int(audio_info.bitrate)
-                if audio_info and getattr(audio_info, "sample_rate", None) is not None:
-                    info["samplerate"] = int(audio_info.sample_rate)
-                if audio_info and getattr(audio_info, "channels", None) is not None:
-                    info["channels"] = int(audio_info.channels)
-            upsert_track(con, info)
-        except Exception as e:
-            logger.warning("[scan] error with %s: %s", p, e)
+                written += _flush(con, pending)
+    finally:
+        written += _flush(con, pending)
+    return written
+
+
+def _flush(con, pending: list[_PendingWrite]) -> int:
+    """Write *pending* in one transaction and return how many files were stored.
+
+    Each file runs inside its own savepoint, so a file whose track row was written
+    but whose full-text row failed leaves nothing behind.
+    """
+
+    if not pending:
+        return 0
+    written = 0
+    with con:
+        if not con.in_transaction:
+            con.execute("BEGIN")
+        for path, fields in pending:
+            con.execute("SAVEPOINT scan_file")
+            try:
+                if path is None:
+                    upsert_track(con, fields, commit=False)
+                else:
+                    update_fields(con, path, fields, commit=False)
+            except Exception as e:
+                con.execute("ROLLBACK TO scan_file")
+                logger.warning("[scan] error writing %s: %s", path or fields.get("path"), e)
+            else:
+                written += 1
+            finally:
+                con.execute("RELEASE scan_file")
+    pending.clear()
+    return written
+
+
+def _read_file(con, p: Path) -> _PendingWrite | None:
+    """Read one file's stat and tags; return the write it needs, if any."""
+
+    if not p.is_file() or not is_audio(p):
+        return None
+    try:
+        stat = p.stat()
+        existing = get_by_path(con, str(p))
+        if (
+            existing
+            and existing["mtime"] == stat.st_mtime
+            and existing["file_size"] == stat.st_size
+        ):
+            if existing["missing"]:
+                return str(p), {"missing": 0}
+            return None
+        info = {"path": str(p), "mtime": stat.st_mtime, "file_size": stat.st_size, "missing": 0}
+        audio = MutagenFile(str(p))
+        if audio:
+            tags = getattr(audio, "tags", None)
+            if tags:
+                info["title"] = _first(tags, TAG_KEY_ALIASES["title"])
+                info["artist"] = _first(tags, TAG_KEY_ALIASES["artist"])
+                info["album"] = _first(tags, TAG_KEY_ALIASES["album"])
+                info["genre"] = _first(tags, TAG_KEY_ALIASES["genre"])
+                info["year"] = _int_or_none(
+                    _first(tags, TAG_KEY_ALIASES["date"])
+                    or _first(tags, TAG_KEY_ALIASES["year"])
+                )
+                info["track_no"] = _int_or_none(_first(tags, TAG_KEY_ALIASES["tracknumber"]))
+            info["format"] = p.suffix.lower().lstrip(".")
+            audio_info = getattr(audio, "info", None)
+            if audio_info and getattr(audio_info, "length", None) is not None:
+                info["duration"] = float(audio_info.length)
+            if audio_info and getattr(audio_info, "bitrate", None) is not None:
+                info["bitrate"] = int(audio_info.bitrate)
+            if audio_info and getattr(audio_info, "sample_rate", None) is not None:
+                info["samplerate"] = int(audio_info.sample_rate)
+            if audio_info and getattr(audio_info, "channels", None) is not None:
+                info["channels"] = int(audio_info.channels)
+    except Exception as e:
+        logger.warning("[scan] error with %s: %s", p, e)
+        return None
+    return None, info
 
 
 def _first(meta, key):
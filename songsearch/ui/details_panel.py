@@ -53,6 +53,9 @@ class _WorkerThread(QThread):
 class DetailsPanel(QWidget):
     """Widget that shows the metadata of the currently selected track."""
 
+    # Emitted with the track path after enrichment rewrote its row in the database.
+    metadata_updated = Signal(str)
+
     def __init__(
         self,
         con: sqlite3.Connection | None = None,
@@ -623,6 +626,7 @@ class DetailsPanel(QWidget):
                 "Metadatos actualizados",
                 "Los metadatos se han actualizado correctamente.",
             )
+            self.metadata_updated.emit(str(path))
             self.show_for_path(str(path))
         else:
             QMessageBox.information(
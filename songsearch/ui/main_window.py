@@ -4,14 +4,21 @@ import html
 import importlib
 import logging
 import os
+import re
 import shutil
 import sqlite3
-import subprocess
+import stat
 import sys
+import threading
 import time
-from collections.abc import Callable, Iterable, Mapping, Sequence
+import unicodedata
+from collections import OrderedDict
+from collections.abc import Callable, Iterable, Iterator, Mapping, Sequence
+from contextlib import contextmanager
+from functools import lru_cache
+from itertools import groupby
 from pathlib import Path
-from typing import Any
+from typing import Any, Final, cast
 
 from dotenv import dotenv_values, find_dotenv, load_dotenv, set_key
 from PySide6.QtCore import (
@@ -19,19 +26,30 @@ from PySide6.QtCore import (
     QItemSelection,
     QItemSelectionModel,
     QModelIndex,
+    QObject,
     QPoint,
+    QRectF,
+    QProcess,
+    QRunnable,
+    QSignalBlocker,
     Qt,
     QThread,
+    QThreadPool,
     QTimer,
+    QUrl,
     Signal,
 )
 from PySide6.QtGui import (
     QAction,
     QCloseEvent,
     QColor,
+    QDesktopServices,
     QGuiApplication,
     QIcon,
     QKeySequence,
+    QPainter,
+    QPaintEvent,
+    QRegion,
 )
 
 try:  # PySide6 < 6.7 exports ``QShortcut`` from ``QtWidgets``
@@ -45,7 +63,6 @@ from PySide6.QtWidgets import (
     QFileDialog,
     QFormLayout,
     QFrame,
-    QGraphicsDropShadowEffect,
     QHBoxLayout,
     QHeaderView,
     QInputDialog,
@@ -66,9 +83,19 @@ from PySide6.QtWidgets import (
 )
 
 from .. import __version__
-from ..core.db import connect, fts_query_from_text, init_db, query_tracks
+from ..core.db import (
+    connect,
+    connect_readonly,
+    count_tracks,
+    explain_tracks_query,
+    fts_plan_uses_index,
+    fts_query_from_text,
+    init_db,
+    optimize_fts,
+    query_tracks,
+)
 from ..core.organizer import apply_plan, simulate
-from ..core.scanner import scan_path
+from ..core.scanner import SCAN_BATCH_SIZE, scan_path
 from ..core.spectrum import open_external
 from .details_panel import DetailsPanel
 from .theme import ensure_styled_background
@@ -77,6 +104,13 @@ logger = logging.getLogger(__name__)
 
 _ICON_DIR = Path(__file__).resolve().parents[2] / "assets" / "icons"
 
+# Plain ints: comparing against these avoids Qt enum operations inside data().
+_DISPLAY_ROLE = int(Qt.DisplayRole)
+_ALIGNMENT_ROLE = int(Qt.TextAlignmentRole)
+_HANDLED_ROLES = frozenset({_DISPLAY_ROLE, _ALIGNMENT_ROLE})
+_RIGHT_ALIGNED = int(Qt.AlignRight | Qt.AlignVCenter)
+_RIGHT_ALIGNED_KEYS = frozenset({"year", "duration", "bitrate"})
+
 _HELP_MODULE_CANDIDATES: tuple[str, ...] = (
     "songsearch.core.help_center",
     "songsearch.core.help",
@@ -84,44 +118,478 @@ _HELP_MODULE_CANDIDATES: tuple[str, ...] = (
 )
 
 
+@lru_cache(maxsize=32)
 def _load_icon(name: str) -> QIcon:
-    """Return a ``QIcon`` for *name* if the asset exists."""
+    """Return a ``QIcon`` for *name* if the asset exists.
+
+    Buttons and actions share the cached icon; ``QIcon`` is implicitly shared, so
+    callers must not modify the returned instance.
+    """
 
     path = _ICON_DIR / name
     return QIcon(str(path)) if path.exists() else QIcon()
 
 
+@lru_cache(maxsize=1)
 def _is_macos() -> bool:
     return sys.platform == "darwin"
 
 
+@lru_cache(maxsize=1)
 def _is_windows() -> bool:
     return sys.platform.startswith("win")
 
 
-class _ScanWorker(QThread):
-    """Background worker that scans a directory without blocking the UI."""
+def _shadow_effects_enabled() -> bool:
+    """Return whether the cards get their drop shadow (off with ``SONGSEARCH_NO_EFFECTS``)."""
+
+    return not os.environ.get("SONGSEARCH_NO_EFFECTS")
+
+
+# Static parts of the help-center overview; only the dependency list is built per call.
+_HELP_OVERVIEW_HEAD: Final = (
+    '<p style="font-size: 15px;">'
+    "SongSearch Organizer reúne tus herramientas en una sola vista con estética macOS."
+    "</p>"
+    "<p><b>Atajos esenciales</b></p>"
+    "<ul>"
+    "<li><b>⌘F / Ctrl+F</b> enfoca la búsqueda instantáneamente.</li>"
+    "<li><b>Enter</b> ejecuta la consulta actual.</li>"
+    "<li><b>Doble clic</b> abre la pista seleccionada con tu reproductor predeterminado.</li>"
+    "<li><b>Clic derecho</b> muestra acciones rápidas sobre la fila.</li>"
+    "</ul>"
+    "<p><b>Estado actual</b></p>"
+)
+_HELP_OVERVIEW_TAIL: Final = (
+    "<p>"
+    "Escribe tu pregunta y pulsa «Preguntar» para consultar al asistente inteligente "
+    "o pide «Sugerir mejoras de la UI» para recibir ideas de refinamiento visual."
+    "</p>"
+)
+
+
+def _sql_debug_enabled() -> bool:
+    """Return whether SQL tracing and the search-plan check are on.
+
+    Enabled with the ``SONGSEARCH_DEBUG_SQL`` environment variable.
+    """
+
+    return bool(os.environ.get("SONGSEARCH_DEBUG_SQL"))
+
+
+def _trace_sql(statement: str) -> None:
+    logger.debug("SQL: %s", statement)
+
+
+@lru_cache(maxsize=8)
+def _which_cached(tool: str, search_path: str) -> bool:
+    """Return whether *tool* is on *search_path*; keyed by PATH so edits invalidate it."""
+
+    return shutil.which(tool, path=search_path) is not None
+
+
+def _open_local(target: Path) -> None:
+    if not QDesktopServices.openUrl(QUrl.fromLocalFile(str(target))):
+        raise OSError(f"No se pudo abrir {target}")
+
+
+def _start_detached(program: str, arguments: list[str]) -> None:
+    result = QProcess.startDetached(program, arguments)
+    started = result[0] if isinstance(result, tuple) else result
+    if not started:
+        raise OSError(f"No se pudo ejecutar {program}")
+
+
+def _reveal_macos(path: Path, target: Path, is_dir: bool, is_file: bool) -> None:
+    if is_dir:
+        _open_local(target)
+    else:
+        _start_detached("open", ["-R", str(path)])
+
+
+def _reveal_windows(path: Path, target: Path, is_dir: bool, is_file: bool) -> None:
+    if is_file:
+        _start_detached("explorer", ["/select,", str(path)])
+    else:
+        _open_local(target)
+
+
+def _reveal_xdg(path: Path, target: Path, is_dir: bool, is_file: bool) -> None:
+    _open_local(path if is_dir else target)
+
+
+if _is_macos():
+    _REVEAL_IMPL: Callable[[Path, Path, bool, bool], None] = _reveal_macos
+elif _is_windows():
+    _REVEAL_IMPL = _reveal_windows
+else:
+    _REVEAL_IMPL = _reveal_xdg
+
+
+class _ScanSignals(QObject):
+    """Signal carrier for :class:`_ScanRunnable` (``QRunnable`` is not a ``QObject``)."""
 
     finished = Signal(Path)
     failed = Signal(object)
 
-    def __init__(self, db_path: Path, target: Path, parent: QWidget | None = None) -> None:
-        super().__init__(parent)
+
+class _ScanRunnable(QRunnable):
+    """Scan a directory on the shared thread pool without blocking the UI."""
+
+    def __init__(self, db_path: Path, target: Path) -> None:
+        super().__init__()
+        self.signals = _ScanSignals()
         self._db_path = db_path
         self._target = target
+        # Set from the GUI thread (e.g. on close); the scan stops after the current file.
+        self.stop_requested = threading.Event()
 
     def run(self) -> None:  # pragma: no cover - heavy IO in background thread
         try:
             con = connect(self._db_path)
             try:
-                scan_path(con, self._target)
+                written = scan_path(
+                    con, self._target, should_interrupt=self.stop_requested.is_set
+                )
+                if written >= SCAN_BATCH_SIZE and not self.stop_requested.is_set():
+                    # Bulk imports leave many small FTS segments behind; merge them once.
+                    optimize_fts(con)
             finally:
                 con.close()
         except Exception as exc:  # noqa: BLE001 - propagate to UI thread
             logger.exception("Background scan failed: %s", exc)
-            self.failed.emit(exc)
+            self.signals.failed.emit(exc)
         else:
-            self.finished.emit(self._target)
+            self.signals.finished.emit(self._target)
+
+
+class _QuerySignals(QObject):
+    """Signal carrier for :class:`_QueryRunnable` (``QRunnable`` is not a ``QObject``)."""
+
+    finished = Signal(int, str, object, int, float)
+    failed = Signal(int, object)
+
+
+# Columns whose values repeat across many rows of a result.
+_SHARED_VALUE_KEYS: Final = ("artist", "album", "album_artist", "genre", "format")
+
+
+def _rows_to_columns(
+    rows: Iterable[Mapping[str, Any] | sqlite3.Row],
+) -> tuple[tuple[str, ...], dict[str, list[Any]]]:
+    """Transpose *rows* into ``(keys, {key: values})`` with one list per field."""
+
+    materialized: list[Mapping[str, Any] | sqlite3.Row] = []
+    for row in rows:
+        if isinstance(row, (Mapping, sqlite3.Row)):
+            materialized.append(row)
+        else:  # pragma: no cover - defensive fallback
+            logger.debug("Cannot normalize row: %r", row)
+
+    if materialized and all(isinstance(row, sqlite3.Row) for row in materialized):
+        keys = tuple(cast(sqlite3.Row, materialized[0]).keys())
+        # ``zip(*rows)`` transposes the rows into columns in C; no per-row dicts.
+        columns = {key: list(values) for key, values in zip(keys, zip(*materialized))}
+    else:
+        mappings = [dict(row) if isinstance(row, sqlite3.Row) else row for row in materialized]
+        keys = tuple(dict.fromkeys(key for row in mappings for key in row))
+        columns = {key: [row.get(key) for row in mappings] for key in keys}
+    for key in _SHARED_VALUE_KEYS:
+        values = columns.get(key)
+        if values:
+            # SQLite returns a fresh str per cell; share one object per distinct value.
+            shared: dict[str, str] = {}
+            columns[key] = [
+                shared.setdefault(value, value) if isinstance(value, str) else value
+                for value in values
+            ]
+    return keys, columns
+
+
+_reader_local = threading.local()
+# Every open reader connection and its database, whichever pool thread owns it.
+# Python does not reliably finalise a ``threading.local`` for Qt-created threads,
+# so the window closes these itself through :func:`_close_reader_connections`.
+_reader_registry: dict[sqlite3.Connection, Path] = {}
+_reader_registry_lock = threading.Lock()
+# How long closeEvent waits for pool work before closing reader connections.
+_POOL_SHUTDOWN_WAIT_MS = 2000
+
+
+def _reader_connection(db_path: Path) -> sqlite3.Connection:
+    """Return the calling pool thread's read-only connection to *db_path*.
+
+    Reusing it keeps SQLite's page cache and mmap warm between searches. It stays
+    open until :func:`_drop_reader_connection` or :func:`_close_reader_connections`;
+    a connection closed by the latter is replaced on the next call.
+    """
+
+    connections: dict[Path, sqlite3.Connection] | None = getattr(
+        _reader_local, "connections", None
+    )
+    if connections is None:
+        connections = _reader_local.connections = {}
+    con = connections.get(db_path)
+    if con is not None:
+        with _reader_registry_lock:
+            if con in _reader_registry:
+                return con
+    con = connections[db_path] = connect_readonly(db_path)
+    if _sql_debug_enabled():
+        con.set_trace_callback(_trace_sql)
+    with _reader_registry_lock:
+        _reader_registry[con] = db_path
+    return con
+
+
+def _drop_reader_connection(db_path: Path) -> None:
+    connections = getattr(_reader_local, "connections", None)
+    con = connections.pop(db_path, None) if connections else None
+    if con is not None:
+        with _reader_registry_lock:
+            _reader_registry.pop(con, None)
+        con.close()
+
+
+def _close_reader_connections(db_path: Path) -> None:
+    """Close every pool thread's reader connection to *db_path*.
+
+    Only call this while no query is running on them, e.g. once the pool is idle.
+    """
+
+    with _reader_registry_lock:
+        connections = [con for con, path in _reader_registry.items() if path == db_path]
+        for con in connections:
+            del _reader_registry[con]
+    for con in connections:
+        try:
+            con.close()
+        except sqlite3.Error:  # pragma: no cover - defensive
+            logger.debug("Error closing reader connection", exc_info=True)
+
+
+def _fetch_results(
+    con: sqlite3.Connection, fts_query: str | None, limit: int
+) -> tuple[tuple[str, ...], dict[str, list[Any]], int]:
+    """Return at most *limit* rows, already split into columns, plus the match count.
+
+    The cap is applied in SQL so an oversized result is never materialised. One
+    extra row is fetched to tell "exactly *limit*" from "more than *limit*", so the
+    ``COUNT(*)`` only runs when rows were really left out. Transposing here keeps
+    that per-row work on the calling (worker) thread.
+    """
+
+    rows = query_tracks(con, fts_query=fts_query, limit=limit + 1)
+    total = len(rows)
+    if total > limit:
+        del rows[limit:]
+        total = count_tracks(con, fts_query=fts_query)
+    keys, columns = _rows_to_columns(rows)
+    return keys, columns, total
+
+
+# The query side mirrors fts_query_from_text (``\w+`` runs); the row side mirrors the
+# unicode61 tokenizer of ``tracks_fts`` (letters and digits, case and accents folded).
+_QUERY_TOKEN_RE = re.compile(r"\w+")
+_ROW_TOKEN_RE = re.compile(r"[^\W_]+")
+_SEARCH_COLUMNS: Final = ("title", "artist", "album", "genre", "path")
+
+
+def _fold_search_text(text: str) -> str:
+    text = text.lower()
+    if text.isascii():
+        return text
+    decomposed = unicodedata.normalize("NFD", text)
+    return "".join(ch for ch in decomposed if not unicodedata.combining(ch))
+
+
+def _folds_like_fts(text: str) -> bool:
+    """Whether :func:`_fold_search_text` and the ``tracks_fts`` tokenizer agree on *text*.
+
+    They do for Latin-1 apart from ``µ``, which unicode61 case-folds to Greek mu.
+    Elsewhere they differ (Greek tonos, ``ſ``, ...), so such text goes to SQL.
+    """
+
+    if text.isascii():
+        return True
+    try:
+        text.encode("latin-1")
+    except UnicodeEncodeError:
+        return False
+    return "µ" not in text
+
+
+def _row_search_text(values: Iterable[Any]) -> str | None:
+    # " word word …": ``" " + token in text`` is then a C-level test for "token
+    # starts some word", which is exactly the FTS ``"token"*`` match.
+    text = " ".join(value for value in values if isinstance(value, str))
+    if not _folds_like_fts(text):
+        return None
+    return " " + " ".join(_ROW_TOKEN_RE.findall(_fold_search_text(text)))
+
+
+def _query_key(query_text: str) -> tuple[bool, str | None]:
+    """Identify what refresh_results would show for *query_text*.
+
+    Texts with the same key produce the same results; the flag separates the empty
+    search (every track) from text without searchable tokens (the search hint).
+    """
+
+    return bool(query_text), fts_query_from_text(query_text) if query_text else None
+
+
+def _search_tokens(query_text: str) -> tuple[str, ...] | None:
+    """Return the folded prefix terms the FTS query for *query_text* ANDs together.
+
+    ``None`` means the query cannot be answered from cached rows: a token with an
+    underscore becomes a multi-word phrase in FTS5, which a prefix test does not model,
+    and text outside Latin-1 is not folded the way ``tracks_fts`` folds it.
+    """
+
+    if not _folds_like_fts(query_text):
+        return None
+    tokens = _QUERY_TOKEN_RE.findall(query_text)
+    if any("_" in token for token in tokens):
+        return None
+    return tuple(_fold_search_text(token) for token in tokens)
+
+
+class _CachedResult:
+    """A query result kept for repeats; complete ones also answer narrower searches."""
+
+    __slots__ = ("tokens", "keys", "columns", "total", "_haystacks", "_narrowable")
+
+    def __init__(
+        self,
+        tokens: tuple[str, ...],
+        keys: tuple[str, ...],
+        columns: dict[str, list[Any]],
+        total: int,
+    ) -> None:
+        self.tokens = tokens
+        self.keys = keys
+        self.columns = columns
+        self.total = total
+        self._haystacks: list[str | None] | None = None
+        self._narrowable: bool | None = None
+
+    def __len__(self) -> int:
+        return len(self.columns[self.keys[0]]) if self.keys else 0
+
+    @property
+    def complete(self) -> bool:
+        return self.total == len(self)
+
+    def results_for(
+        self, tokens: tuple[str, ...]
+    ) -> tuple[tuple[str, ...], dict[str, list[Any]], int]:
+        """Return ``(keys, columns, total)`` for *tokens*, filtering unless they match."""
+
+        if tokens == self.tokens:
+            return self.keys, self.columns, self.total
+        keys, columns = self.narrow(tokens)
+        return keys, columns, len(columns[keys[0]]) if keys else 0
+
+    @property
+    def narrowable(self) -> bool:
+        """Whether :meth:`narrow` matches FTS exactly: every row's text folds like it."""
+
+        if self._narrowable is None:
+            self._narrowable = None not in self._search_haystacks()
+        return self._narrowable
+
+    def _search_haystacks(self) -> list[str | None]:
+        haystacks = self._haystacks
+        if haystacks is None:
+            # Built on first use so results that are never narrowed cost nothing.
+            empty: list[Any] = [None] * len(self)
+            sources = [self.columns.get(key, empty) for key in _SEARCH_COLUMNS]
+            haystacks = self._haystacks = [_row_search_text(values) for values in zip(*sources)]
+        return haystacks
+
+    def narrow(self, tokens: tuple[str, ...]) -> tuple[tuple[str, ...], dict[str, list[Any]]]:
+        """Return the rows where every token prefixes a word, in the cached order.
+
+        Only exact when :attr:`narrowable`; rows whose text does not fold like FTS
+        never match.
+        """
+
+        needles = [" " + token for token in tokens]
+        rows = [
+            row
+            for row, text in enumerate(self._search_haystacks())
+            if text is not None and all(needle in text for needle in needles)
+        ]
+        columns = {key: [values[row] for row in rows] for key, values in self.columns.items()}
+        return self.keys, columns
+
+
+class _QueryRunnable(QRunnable):
+    """Run a library query on the shared thread pool over a per-thread read-only connection."""
+
+    def __init__(
+        self, db_path: Path, seq: int, query_text: str, fts_query: str | None, limit: int
+    ) -> None:
+        super().__init__()
+        self.signals = _QuerySignals()
+        self._db_path = db_path
+        self._seq = seq
+        self._query_text = query_text
+        self._fts_query = fts_query
+        self._limit = limit
+        self._cancelled = False
+        self._close_reader = False
+        self._con: sqlite3.Connection | None = None
+        # Guards ``_con`` so an interrupt never reaches the thread's next query on the
+        # same reused connection.
+        self._con_lock = threading.Lock()
+        # MainWindow holds the runnable until it reports back, so cancel() stays valid.
+        self.setAutoDelete(False)
+
+    def cancel(self, *, close_reader: bool = False) -> None:
+        """Abort the query if it has not finished; safe to call from the GUI thread.
+
+        With *close_reader* the pool thread also closes its reader connection once
+        it is done with it, e.g. because the window is closing.
+        """
+
+        with self._con_lock:
+            self._cancelled = True
+            self._close_reader = self._close_reader or close_reader
+            if self._con is not None:
+                try:
+                    self._con.interrupt()
+                except sqlite3.ProgrammingError:  # closed in the meantime
+                    pass
+
+    def run(self) -> None:  # pragma: no cover - runs in a pool thread
+        start = time.perf_counter()
+        try:
+            con = _reader_connection(self._db_path)
+            with self._con_lock:
+                self._con = con
+            try:
+                if self._cancelled:
+                    raise sqlite3.OperationalError("interrupted")
+                keys, columns, total = _fetch_results(con, self._fts_query, self._limit)
+            finally:
+                with self._con_lock:
+                    self._con = None
+        except Exception as exc:  # noqa: BLE001 - propagate to UI thread
+            if not self._cancelled:
+                logger.exception("Background query failed: %s", exc)
+                # Start from a fresh connection next time in case this one is broken.
+                _drop_reader_connection(self._db_path)
+            self.signals.failed.emit(self._seq, exc)
+        else:
+            elapsed_ms = (time.perf_counter() - start) * 1000.0
+            self.signals.finished.emit(
+                self._seq, self._query_text, (keys, columns), total, elapsed_ms
+            )
+        with self._con_lock:
+            close_reader = self._close_reader
+        if close_reader:
+            _drop_reader_connection(self._db_path)
 
 
 class _HelpWorker(QThread):
@@ -318,10 +786,39 @@ class TrackTableModel(QAbstractTableModel):
         ("format", "Formato"),
         ("path", "Ruta"),
     )
+    # Initial column widths in pixels; the view never sizes columns from their contents.
+    DEFAULT_WIDTHS: dict[str, int] = {
+        "title": 220,
+        "artist": 170,
+        "album": 190,
+        "genre": 110,
+        "year": 60,
+        "duration": 80,
+        "bitrate": 90,
+        "format": 80,
+        "path": 320,
+    }
+    # Flat lookups derived once from COLUMNS for the data()/headerData() hot paths.
+    _KEYS: tuple[str, ...] = tuple(key for key, _ in COLUMNS)
+    _HEADERS: tuple[str, ...] = tuple(header for _, header in COLUMNS)
+    _COLUMN_COUNT: int = len(COLUMNS)
+    _ALIGNMENT: tuple[int, ...] = tuple(
+        _RIGHT_ALIGNED if key in _RIGHT_ALIGNED_KEYS else 0 for key in _KEYS
+    )
+    # Rows exposed to the view per ``fetchMore`` call.
+    FETCH_PAGE = 200
 
     def __init__(self, parent: QWidget | None = None) -> None:
         super().__init__(parent)
-        self._rows: list[dict[str, Any]] = []
+        self._keys: tuple[str, ...] = ()
+        self._columns: dict[str, list[Any]] = {}
+        self._paths: list[str | None] = []
+        self._path_to_row: dict[str | None, int] = {}
+        self._display_columns: list[tuple[str, list[Any]]] = []
+        # Formatted cells per result row, filled in by data() the first time a row is
+        # painted; ``_loaded`` is how many rows the view has been told about.
+        self._display: list[list[str] | None] = []
+        self._loaded = 0
 
     # ------------------------------------------------------------------
     # Qt model API
@@ -329,29 +826,32 @@ class TrackTableModel(QAbstractTableModel):
     def rowCount(self, parent: QModelIndex | None = None) -> int:  # noqa: N802
         if parent is not None and parent.isValid():
             return 0
-        return len(self._rows)
+        return self._loaded
 
     def columnCount(self, parent: QModelIndex | None = None) -> int:  # noqa: N802
         if parent is not None and parent.isValid():
             return 0
-        return len(self.COLUMNS)
+        return self._COLUMN_COUNT
 
     def data(self, index: QModelIndex, role: int = Qt.DisplayRole) -> Any:
-        if not index.isValid():
+        # Views query many roles per cell and paint; bail out before touching the index.
+        if role not in _HANDLED_ROLES:
             return None
         row = index.row()
         column = index.column()
-        if row < 0 or row >= len(self._rows) or column < 0 or column >= len(self.COLUMNS):
+        # An invalid index reports row/column -1, so the bounds check also covers it.
+        if not (0 <= row < self._loaded and 0 <= column < self._COLUMN_COUNT):
             return None
 
-        key = self.COLUMNS[column][0]
-        value = self._rows[row].get(key)
-
-        if role == Qt.DisplayRole:
-            return self._format_value(key, value)
-        if role == Qt.TextAlignmentRole and key in {"year", "duration", "bitrate"}:
-            return int(Qt.AlignRight | Qt.AlignVCenter)
-        return None
+        if role == _DISPLAY_ROLE:
+            cells = self._display[row]
+            if cells is None:
+                cells = self._display[row] = [
+                    self._format_value(key, values[row]) for key, values in self._display_columns
+                ]
+            return cells[column]
+        # Only the alignment role is left after the _HANDLED_ROLES check.
+        return self._ALIGNMENT[column] or None
 
     def headerData(  # noqa: N802
         self, section: int, orientation: Qt.Orientation, role: int = Qt.DisplayRole
@@ -359,8 +859,8 @@ class TrackTableModel(QAbstractTableModel):
         if role != Qt.DisplayRole:
             return None
         if orientation == Qt.Horizontal:
-            if 0 <= section < len(self.COLUMNS):
-                return self.COLUMNS[section][1]
+            if 0 <= section < len(self._HEADERS):
+                return self._HEADERS[section]
             return None
         return section + 1
 
@@ -369,35 +869,112 @@ class TrackTableModel(QAbstractTableModel):
             return Qt.ItemIsEnabled
         return Qt.ItemIsEnabled | Qt.ItemIsSelectable
 
+    def canFetchMore(self, parent: QModelIndex) -> bool:  # noqa: N802
+        if parent.isValid():
+            return False
+        return self._loaded < len(self._paths)
+
+    def fetchMore(self, parent: QModelIndex) -> None:  # noqa: N802
+        if parent.isValid():
+            return
+        self.ensure_loaded(self._loaded + self.FETCH_PAGE - 1)
+
     # ------------------------------------------------------------------
     # Helpers
     # ------------------------------------------------------------------
     def set_rows(self, rows: Iterable[Mapping[str, Any] | sqlite3.Row]) -> None:
-        normalized: list[dict[str, Any]] = []
-        for row in rows:
-            try:
-                normalized.append(dict(row))
-            except Exception:  # pragma: no cover - defensive fallback
-                logger.debug("Cannot normalize row: %r", row)
-        self.beginResetModel()
-        self._rows = normalized
-        self.endResetModel()
+        self.set_columns(*_rows_to_columns(rows))
+
+    def set_columns(self, keys: tuple[str, ...], columns: dict[str, list[Any]]) -> None:
+        """Adopt a result already transposed by :func:`_rows_to_columns`.
+
+        Struct-of-arrays: one list per field instead of one dict per row.
+        """
+
+        count = len(columns[keys[0]]) if keys else 0
+        missing: list[Any] = [None] * count
+        display_columns = [(key, columns.get(key, missing)) for key in self._KEYS]
+        # Nothing is formatted here: data() formats a row when the view first paints it.
+        display: list[list[str] | None] = [None] * count
+        paths = [path if isinstance(path, str) else None for path in columns.get("path", missing)]
+
+        old_count = self._loaded
+        new_count = min(count, self.FETCH_PAGE)
+        # Emit row deltas + dataChanged rather than a full reset so the view keeps its
+        # header geometry and scroll state between searches.
+        if new_count < old_count:
+            self.beginRemoveRows(QModelIndex(), new_count, old_count - 1)
+            self._store_rows(keys, columns, display_columns, display, paths, new_count)
+            self.endRemoveRows()
+            changed = new_count
+        elif new_count > old_count:
+            self.beginInsertRows(QModelIndex(), old_count, new_count - 1)
+            self._store_rows(keys, columns, display_columns, display, paths, new_count)
+            self.endInsertRows()
+            changed = old_count
+        else:
+            self._store_rows(keys, columns, display_columns, display, paths, new_count)
+            changed = new_count
+        if changed > 0:
+            self.dataChanged.emit(
+                self.index(0, 0),
+                self.index(changed - 1, self._COLUMN_COUNT - 1),
+                [Qt.DisplayRole],
+            )
+
+    def _store_rows(
+        self,
+        keys: tuple[str, ...],
+        columns: dict[str, list[Any]],
+        display_columns: list[tuple[str, list[Any]]],
+        display: list[list[str] | None],
+        paths: list[str | None],
+        loaded: int,
+    ) -> None:
+        self._keys = keys
+        self._columns = columns
+        self._display_columns = display_columns
+        self._display = display
+        self._loaded = loaded
+        self._paths = paths
+        # Built in C; a ``None`` key is harmless because index_for_path rejects falsy paths.
+        self._path_to_row = dict(zip(paths, range(len(paths))))
+
+    def ensure_loaded(self, row: int) -> None:
+        """Expose rows to the view up to and including *row* (clamped to the result)."""
+
+        loaded = self._loaded
+        stop = min(row + 1, len(self._paths))
+        if stop <= loaded:
+            return
+        self.beginInsertRows(QModelIndex(), loaded, stop - 1)
+        self._loaded = stop
+        self.endInsertRows()
+
+    def total_rows(self) -> int:
+        """Return the size of the current result, including rows not loaded yet."""
+
+        return len(self._paths)
 
     def clear(self) -> None:
         self.set_rows([])
 
     def row_data(self, row: int) -> dict[str, Any] | None:
-        if 0 <= row < len(self._rows):
-            return self._rows[row]
+        if 0 <= row < len(self._paths):
+            return {key: self._columns[key][row] for key in self._keys}
         return None
 
+    def paths_snapshot(self) -> list[str | None]:
+        """Return the path column, indexed by row; callers must not mutate it."""
+
+        return self._paths
+
     def index_for_path(self, path: str | None) -> int | None:
+        """Return the result row for *path*; call :meth:`ensure_loaded` before using it."""
+
         if not path:
             return None
-        for idx, row in enumerate(self._rows):
-            if row.get("path") == path:
-                return idx
-        return None
+        return self._path_to_row.get(path)
 
     def _format_value(self, key: str, value: Any) -> str:
         if value in (None, ""):
@@ -420,6 +997,65 @@ class TrackTableModel(QAbstractTableModel):
         return str(value)
 
 
+class _TrackTableView(QTableView):
+    """Table view whose column size hints never walk the model's rows."""
+
+    def sizeHintForColumn(self, column: int) -> int:  # noqa: N802
+        # Qt's default formats every row of the column to measure it, which is what a
+        # header double-click (resizeColumnToContents) would otherwise trigger.
+        keys = TrackTableModel._KEYS
+        if 0 <= column < len(keys):
+            return TrackTableModel.DEFAULT_WIDTHS.get(keys[column], 120)
+        return super().sizeHintForColumn(column)
+
+
+class _CardSplitter(QSplitter):
+    """Splitter that paints a static drop shadow behind each of its cards.
+
+    A ``QGraphicsDropShadowEffect`` renders its card offscreen and blurs it again on
+    every repaint of anything inside, table scrolling included. Here the shadow is a
+    few translucent rounded rects drawn by the splitter, outside the cards only, so
+    repaints inside a card never reach it.
+    """
+
+    SHADOW_OFFSET = 14
+    SHADOW_SPREAD = 14
+    SHADOW_LAYERS = 7
+    SHADOW_RADIUS = 24  # matches the cards' border-radius in THEME_CSS
+    # Stacked layers add up to roughly the former effect's alpha (150) at the core.
+    SHADOW_COLOR = QColor(7, 10, 22, 30)
+
+    def __init__(self, orientation: Qt.Orientation, parent: QWidget | None = None) -> None:
+        super().__init__(orientation, parent)
+        self._shadows = _shadow_effects_enabled()
+
+    def paintEvent(self, event: QPaintEvent) -> None:  # noqa: N802
+        super().paintEvent(event)
+        if not self._shadows:
+            return
+        cards = [card for card in map(self.widget, range(self.count())) if card.isVisible()]
+        covered = QRegion()
+        for card in cards:
+            covered = covered.united(card.geometry())
+        region = event.region().subtracted(covered)
+        if region.isEmpty():
+            return
+
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.setClipRegion(region)
+        painter.setPen(Qt.NoPen)
+        painter.setBrush(self.SHADOW_COLOR)
+        step = self.SHADOW_SPREAD / self.SHADOW_LAYERS
+        for card in cards:
+            rect = QRectF(card.geometry()).translated(0, self.SHADOW_OFFSET)
+            for layer in range(1, self.SHADOW_LAYERS + 1):
+                grow = step * layer
+                radius = self.SHADOW_RADIUS + grow
+                painter.drawRoundedRect(rect.adjusted(-grow, -grow, grow, grow), radius, radius)
+        painter.end()
+
+
 class ApiCredentialsDialog(QDialog):
     """Simple dialog to capture API credentials from the user."""
 
@@ -486,7 +1122,29 @@ class MainWindow(QMainWindow):
     """Main application window for the SongSearch Organizer UI."""
 
     MAX_RESULTS = 5000
-    SEARCH_DEBOUNCE_MS = 250
+    # Above this many rows the table is painted without alternating row colours.
+    ALTERNATE_ROWS_LIMIT = 1000
+    SEARCH_DEBOUNCE_MS = 150
+    # Keystrokes closer together than this (pastes, key repeat) share one timer start.
+    SEARCH_BURST_NS = 16_000_000
+    # Complete results kept so a longer query can be filtered in memory instead of SQL.
+    RESULT_CACHE_SIZE = 8
+    # Arrow-key navigation only fills the inspector for the row it settles on.
+    DETAILS_DEBOUNCE_MS = 60
+
+    _OPEN_TIP: Final = "Abrir la pista seleccionada con la aplicación predeterminada del sistema."
+    _OPEN_DISABLED_TIP: Final = "Selecciona una pista para poder abrirla."
+    _REVEAL_TIP: Final = (
+        "Abrir el explorador de archivos en la ubicación de la pista seleccionada."
+    )
+    _REVEAL_DISABLED_TIP: Final = "Selecciona una pista para mostrarla en la carpeta."
+    _COPY_DISABLED_TIP: Final = "Selecciona al menos una pista para copiar su ruta."
+    _ENRICH_DEFAULT_HINT: Final = "Configura las APIs para habilitar el enriquecimiento."
+    _SPECTRUM_DEFAULT_HINT: Final = "Instala ffmpeg para generar espectros."
+    _SIMULATE_TIP: Final = "Genera un plan de organización sin aplicar cambios."
+    _SIMULATE_DISABLED_TIP: Final = "Conecta una base de datos para simular la biblioteca."
+    _APPLY_PLAN_TIP: Final = "Aplica el último plan de organización generado."
+    _PLAN_HINT: Final = "Genera un plan con «Simular biblioteca» para habilitar esta acción."
 
     def __init__(
         self,
@@ -498,7 +1156,10 @@ class MainWindow(QMainWindow):
         self._data_dir = (data_dir or Path.home() / ".songsearch").expanduser()
         self._owns_connection = con is None
         self._db_path: Path | None = None
+        self._db_path_cache: dict[int, Path | None] = {}
         self._env_path = self._data_dir / ".env"
+        # (st_mtime_ns, parsed values) of ``_env_path``; re-parsed only when it changes.
+        self._env_cache: tuple[int, dict[str, str | None]] | None = None
         self._load_env_files()
         self._api_key: str = ""
         self._musicbrainz_ua: str = ""
@@ -524,15 +1185,35 @@ class MainWindow(QMainWindow):
         self._details.btn_open.clicked.connect(self._open_selected_track)
         self._details.btn_reveal.clicked.connect(self._reveal_selected_track)
         self._details.btn_copy_path.clicked.connect(self._copy_selected_paths)
+        self._details.metadata_updated.connect(self._invalidate_result_cache)
         self._current_path: str | None = None
-
+        # Paths of the selected rows; rebuilt lazily after the selection or rows change.
+        self._selected_paths_cache: list[str] | None = None
+        self._table_menu: QMenu | None = None
+
+        self._query_seq = 0
+        self._query_runnables: dict[int, _QueryRunnable] = {}
+        self._result_cache: OrderedDict[tuple[str, ...], _CachedResult] = OrderedDict()
+        # Queries issued before the last invalidation may have read stale rows.
+        self._result_cache_min_seq = 0
+        # Query key of the results on screen; None once the library has changed.
+        self._shown_query_key: tuple[bool, str | None] | None = None
+        self._last_keystroke_ns = 0
+        self._last_search_text = ""
         self._search_timer = QTimer(self)
         self._search_timer.setSingleShot(True)
         self._search_timer.setInterval(self.SEARCH_DEBOUNCE_MS)
-        self._search_timer.timeout.connect(self.refresh_results)
+        self._search_timer.timeout.connect(self._on_search_timeout)
+
+        self._pending_details: dict[str, Any] | None = None
+        self._shown_details: dict[str, Any] | None = None
+        self._details_timer = QTimer(self)
+        self._details_timer.setSingleShot(True)
+        self._details_timer.setInterval(self.DETAILS_DEBOUNCE_MS)
+        self._details_timer.timeout.connect(self._apply_pending_details)
 
         self._search = QLineEdit(self)
-        self._table = QTableView(self)
+        self._table = _TrackTableView(self)
         self._status = QStatusBar(self)
 
         self._btn_scan: QPushButton | None = None
@@ -541,7 +1222,8 @@ class MainWindow(QMainWindow):
         self._btn_enrich: QPushButton | None = None
         self._btn_spectrum: QPushButton | None = None
         self._btn_config: QPushButton | None = None
-        self._scan_worker: _ScanWorker | None = None
+        self._scan_signals: _ScanSignals | None = None
+        self._scan_stop: threading.Event | None = None
         self._summary_badge: QLabel | None = None
         self._help_button: QPushButton | None = None
         self._help_dialog: _HelpCenterDialog | None = None
@@ -580,6 +1262,8 @@ class MainWindow(QMainWindow):
         self._action_copy_default_tip = (
             "Copiar al portapapeles la ruta de las pistas seleccionadas."
         )
+        self._action_state_cache: dict[int, tuple[bool, str | None, str | None]] = {}
+        self._last_action_state: tuple[Any, ...] | None = None
         self._organizer_plan: list[tuple[str, str]] = []
         self._organizer_plan_dest: Path | None = None
         self._organizer_plan_template: str | None = None
@@ -593,6 +1277,10 @@ class MainWindow(QMainWindow):
         self._build_menus()
         self._setup_shortcuts()
         self._refresh_dependency_state()
+        if _sql_debug_enabled():
+            self._check_search_plan()
+        # The first query runs on the pool; the window paints while it does.
+        self._status.showMessage("Cargando biblioteca…")
         self.refresh_results()
         QTimer.singleShot(0, self._handle_startup_prompts)
 
@@ -606,8 +1294,18 @@ class MainWindow(QMainWindow):
         if self._env_path.exists():
             load_dotenv(self._env_path, override=False)
 
+    def _stored_env_values(self) -> dict[str, str | None]:
+        try:
+            mtime = self._env_path.stat().st_mtime_ns
+        except OSError:
+            self._env_cache = None
+            return {}
+        if self._env_cache is None or self._env_cache[0] != mtime:
+            self._env_cache = (mtime, dict(dotenv_values(self._env_path)))
+        return self._env_cache[1]
+
     def _load_api_credentials(self) -> None:
-        stored = dotenv_values(self._env_path) if self._env_path.exists() else {}
+        stored = self._stored_env_values()
         self._api_key = (
             os.getenv("ACOUSTID_API_KEY") or stored.get("ACOUSTID_API_KEY", "")
         ).strip()
@@ -654,6 +1352,7 @@ class MainWindow(QMainWindow):
                 quote_mode="never",
             )
         except Exception as exc:  # noqa: BLE001 - mostrar el error al usuario
+            self._env_cache = None
             logger.exception("No se pudieron guardar las credenciales: %s", exc)
             QMessageBox.critical(
                 self,
@@ -662,6 +1361,8 @@ class MainWindow(QMainWindow):
             )
             return
 
+        # A rewrite within the filesystem's mtime granularity would look unchanged.
+        self._env_cache = None
         os.environ["ACOUSTID_API_KEY"] = api_key
         os.environ["MUSICBRAINZ_USER_AGENT"] = musicbrainz
         self._api_key = api_key
@@ -669,8 +1370,9 @@ class MainWindow(QMainWindow):
 
     def _refresh_dependency_state(self) -> None:
         self._load_api_credentials()
-        ffmpeg_available = shutil.which("ffmpeg") is not None
-        fpcalc_available = shutil.which("fpcalc") is not None
+        search_path = os.environ.get("PATH", os.defpath)
+        ffmpeg_available = _which_cached("ffmpeg", search_path)
+        fpcalc_available = _which_cached("fpcalc", search_path)
         self._dependency_state = {"ffmpeg": ffmpeg_available, "fpcalc": fpcalc_available}
 
         if ffmpeg_available:
@@ -783,7 +1485,7 @@ class MainWindow(QMainWindow):
         if self._action_focus_search is None:
             combos.append((QKeySequence.Find, self._focus_search))
         if self._action_refresh is None:
-            combos.append((QKeySequence.Refresh, self.refresh_results))
+            combos.append((QKeySequence.Refresh, self._reload_results))
         for sequence, handler in combos:
             shortcut = QShortcut(sequence, self)
             shortcut.activated.connect(handler)
@@ -803,35 +1505,19 @@ class MainWindow(QMainWindow):
         self._update_action_state()
 
     def _select_all_rows(self) -> None:
+        # The table is bound straight to the source model (search filters in SQL), so
+        # ``selectAll`` never goes through a proxy's ``mapSelectionFromSource``.
+        if self._model.total_rows() <= 0:
+            return
+        # Select-all means the whole result, not just the pages loaded so far.
+        self._model.ensure_loaded(self._model.total_rows() - 1)
         self._table.setFocus(Qt.ShortcutFocusReason)
         self._table.selectAll()
 
     def _build_help_overview_html(self) -> str:
-        tips = """
-        <ul>
-            <li><b>⌘F / Ctrl+F</b> enfoca la búsqueda instantáneamente.</li>
-            <li><b>Enter</b> ejecuta la consulta actual.</li>
-            <li><b>Doble clic</b> abre la pista seleccionada con tu reproductor predeterminado.</li>
-            <li><b>Clic derecho</b> muestra acciones rápidas sobre la fila.</li>
-        </ul>
-        """.strip()
-
         dependency_lines: list[str] = []
         ffmpeg_ok = self._dependency_state.get("ffmpeg", False)
         fpcalc_ok = self._dependency_state.get("fpcalc", False)
-        # fmt: off
-        ffmpeg_text = (
-            "✅ listo"
-            if ffmpeg_ok
-            else self._dependency_hint("ffmpeg").replace("\n", "<br/>")
-        )
-        dependency_lines.append(f"<li><b>ffmpeg</b>: {ffmpeg_text}</li>")
-        fpcalc_text = (
-            "✅ listo"
-            if fpcalc_ok
-            else self._dependency_hint("fpcalc").replace("\n", "<br/>")
-        )
-        # fmt: on
         if ffmpeg_ok:
             ffmpeg_text = "✅ listo"
         else:
@@ -851,19 +1537,7 @@ class MainWindow(QMainWindow):
             )
 
         dependencies = "<ul>" + "".join(dependency_lines) + "</ul>"
-        return (
-            '<p style="font-size: 15px;">'
-            "SongSearch Organizer reúne tus herramientas en una sola vista con estética macOS."
-            "</p>"
-            "<p><b>Atajos esenciales</b></p>"
-            f"{tips}"
-            "<p><b>Estado actual</b></p>"
-            f"{dependencies}"
-            "<p>"
-            "Escribe tu pregunta y pulsa «Preguntar» para consultar al asistente inteligente "
-            "o pide «Sugerir mejoras de la UI» para recibir ideas de refinamiento visual."
-            "</p>"
-        )
+        return _HELP_OVERVIEW_HEAD + dependencies + _HELP_OVERVIEW_TAIL
 
     def _open_help_center(self) -> None:  # pragma: no cover - UI dialog
         self._refresh_dependency_state()
@@ -1277,7 +1951,7 @@ class MainWindow(QMainWindow):
         header_layout.addWidget(toolbar_frame)
         layout.addWidget(header)
 
-        splitter = QSplitter(Qt.Horizontal, central)
+        splitter = _CardSplitter(Qt.Horizontal, central)
         splitter.setChildrenCollapsible(False)
         splitter.setOpaqueResize(False)
 
@@ -1308,7 +1982,13 @@ class MainWindow(QMainWindow):
         self._table.setAlternatingRowColors(True)
         self._table.setSortingEnabled(False)
         self._table.setWordWrap(False)
-        self._table.verticalHeader().setVisible(False)
+        vertical_header = self._table.verticalHeader()
+        vertical_header.setVisible(False)
+        # Fixed, uniform rows: the view never asks the model for per-row size hints.
+        vertical_header.setSectionResizeMode(QHeaderView.Fixed)
+        vertical_header.setDefaultSectionSize(self._table.fontMetrics().height() + 10)
+        self._table.setVerticalScrollMode(QAbstractItemView.ScrollPerPixel)
+        self._table.setHorizontalScrollMode(QAbstractItemView.ScrollPerPixel)
         self._table.setContextMenuPolicy(Qt.CustomContextMenu)
         self._table.customContextMenuRequested.connect(self._show_table_context_menu)
         header_view = self._table.horizontalHeader()
@@ -1317,6 +1997,8 @@ class MainWindow(QMainWindow):
         header_view.setSectionResizeMode(QHeaderView.Interactive)
         header_view.setHighlightSections(False)
         header_view.setDefaultAlignment(Qt.AlignLeft | Qt.AlignVCenter)
+        for column, key in enumerate(TrackTableModel._KEYS):
+            header_view.resizeSection(column, TrackTableModel.DEFAULT_WIDTHS.get(key, 120))
         table_layout.addWidget(self._table)
 
         details_card = QFrame(splitter)
@@ -1343,13 +2025,6 @@ class MainWindow(QMainWindow):
         details_layout.addLayout(inspector_header)
         details_layout.addWidget(self._details, 1)
 
-        for card in (table_card, details_card):
-            shadow = QGraphicsDropShadowEffect(card)
-            shadow.setBlurRadius(28)
-            shadow.setOffset(0, 14)
-            shadow.setColor(QColor(7, 10, 22, 150))
-            card.setGraphicsEffect(shadow)
-
         splitter.addWidget(table_card)
         splitter.addWidget(details_card)
         splitter.setStretchFactor(0, 3)
@@ -1443,7 +2118,7 @@ class MainWindow(QMainWindow):
         self._action_refresh = QAction(_load_icon("refresh.png"), "Actualizar resultados", self)
         self._action_refresh.setShortcut(QKeySequence(QKeySequence.StandardKey.Refresh))
         self._action_refresh.setStatusTip("Vuelve a ejecutar la búsqueda actual.")
-        self._action_refresh.triggered.connect(self.refresh_results)
+        self._action_refresh.triggered.connect(self._reload_results)
 
         self._action_enrich = QAction(_load_icon("enrich.png"), "Enriquecer", self)
         self._action_enrich.setShortcut(QKeySequence("Ctrl+E"))
@@ -1488,6 +2163,7 @@ class MainWindow(QMainWindow):
             if action is not None:
                 self.addAction(action)
 
+        self._last_action_state = None
         self._update_action_state()
 
     def _build_menus(self) -> None:
@@ -1527,7 +2203,7 @@ class MainWindow(QMainWindow):
     # Actions
     # ------------------------------------------------------------------
     def _open_scan_dialog(self) -> None:  # pragma: no cover - UI callback
-        if self._scan_worker is not None and self._scan_worker.isRunning():
+        if self._scan_signals is not None:
             QMessageBox.information(
                 self,
                 "Escaneo en progreso",
@@ -1562,27 +2238,30 @@ class MainWindow(QMainWindow):
             )
             return
 
-        worker = _ScanWorker(db_path, directory, self)
-        worker.finished.connect(self._on_scan_finished)
-        worker.failed.connect(self._on_scan_failed)
-        worker.finished.connect(self._reset_scan_worker)
-        worker.failed.connect(self._reset_scan_worker)
-        worker.finished.connect(worker.deleteLater)
-        worker.failed.connect(worker.deleteLater)
-        self._scan_worker = worker
+        runnable = _ScanRunnable(db_path, directory)
+        signals = runnable.signals
+        self._invalidate_result_cache()
+        signals.finished.connect(self._on_scan_finished)
+        signals.failed.connect(self._on_scan_failed)
+        signals.finished.connect(self._reset_scan_worker)
+        signals.failed.connect(self._reset_scan_worker)
+        self._scan_signals = signals
+        self._scan_stop = runnable.stop_requested
         if self._btn_scan is not None:
             self._btn_scan.setEnabled(False)
         if self._action_scan is not None:
             self._action_scan.setEnabled(False)
         self._status.showMessage(f"Escaneando {directory}…")
-        worker.start()
+        QThreadPool.globalInstance().start(runnable)
 
     def _reset_scan_worker(self) -> None:
         if self._btn_scan is not None:
             self._btn_scan.setEnabled(True)
         if self._action_scan is not None:
             self._action_scan.setEnabled(True)
-        self._scan_worker = None
+        self._scan_signals = None
+        self._scan_stop = None
+        self._invalidate_result_cache()
         self._update_action_state()
 
     def _on_scan_finished(self, directory: Path) -> None:
@@ -1849,6 +2528,7 @@ class MainWindow(QMainWindow):
         self._status.showMessage(f"{mode_label} completado. Undo: {undo_str}", 8000)
         self._organizer_plan = []
         self._organizer_plan_dest = None
+        self._invalidate_result_cache()
         self._update_action_state()
         self.refresh_results()
 
@@ -1868,6 +2548,10 @@ class MainWindow(QMainWindow):
         paths = self._selected_paths()
         if not paths:
             return None
+        if self._table_menu is not None:
+            # The menu only holds the window's shared QActions, whose enabled state and
+            # tips _update_action_state keeps current; build it once and reuse it.
+            return self._table_menu
 
         menu = QMenu(self)
 
@@ -1884,15 +2568,16 @@ class MainWindow(QMainWindow):
         add_group(self._action_spectrum, self._action_enrich)
         add_group(self._action_copy_paths)
 
+        self._table_menu = menu
         return menu
 
     def _open_selected_track(self) -> None:
-        paths = self._selected_paths()
-        if not paths:
+        target = self._primary_selected_path()
+        if target is None:
             QMessageBox.information(self, "Sin selección", "Selecciona una pista para abrirla.")
             return
 
-        path = paths[0]
+        path = Path(target)
         if not path.exists():
             QMessageBox.warning(
                 self,
@@ -1910,8 +2595,8 @@ class MainWindow(QMainWindow):
             )
 
     def _reveal_selected_track(self) -> None:
-        paths = self._selected_paths()
-        if not paths:
+        target = self._primary_selected_path()
+        if target is None:
             QMessageBox.information(
                 self,
                 "Sin selección",
@@ -1919,7 +2604,7 @@ class MainWindow(QMainWindow):
             )
             return
 
-        self._reveal_in_file_manager(paths[0])
+        self._reveal_in_file_manager(Path(target))
 
     def _copy_selected_paths(self) -> None:
         paths = self._selected_paths()
@@ -1928,7 +2613,7 @@ class MainWindow(QMainWindow):
             return
 
         clipboard = QGuiApplication.clipboard()
-        clipboard.setText("\n".join(str(p) for p in paths))
+        clipboard.setText("\n".join(paths))
         self._status.showMessage("Ruta copiada al portapapeles", 3000)
 
     def _enrich_selected(self) -> None:
@@ -1940,6 +2625,7 @@ class MainWindow(QMainWindow):
             )
             return
         # Delegamos en el panel de detalles para reutilizar la lógica existente.
+        self._flush_pending_details()
         self._details.btn_enrich.click()
 
     def _generate_spectrum_selected(self) -> None:
@@ -1950,41 +2636,69 @@ class MainWindow(QMainWindow):
                 "Selecciona una pista antes de generar el espectro.",
             )
             return
+        self._flush_pending_details()
         self._details.btn_spectrum.click()
 
     # ------------------------------------------------------------------
     # Event handlers
     # ------------------------------------------------------------------
-    def _on_search_text_changed(self, _: str) -> None:
-        self._search_timer.start()
+    def _on_search_text_changed(self, text: str) -> None:
+        normalized = text.strip()
+        if normalized == self._last_search_text:
+            # Leading/trailing whitespace only: the pending timer or query still applies.
+            self._update_action_state()
+            return
+        self._last_search_text = normalized
+        self._query_seq += 1
+        self._cancel_pending_queries()
+        now = time.monotonic_ns()
+        burst = now - self._last_keystroke_ns < self.SEARCH_BURST_NS
+        self._last_keystroke_ns = now
+        if not (burst and self._search_timer.isActive()):
+            self._search_timer.start()
         self._update_action_state()
 
+    def _on_search_timeout(self) -> None:
+        # Edits that leave the FTS query as it was (case, spacing, punctuation) keep the
+        # results on screen; the keystroke already cancelled any query in flight.
+        if _query_key(self._search.text().strip()) == self._shown_query_key:
+            return
+        self.refresh_results()
+
     def _on_selection_changed(
         self, selected: QItemSelection, _: QItemSelection
     ) -> None:  # pragma: no cover - UI callback
-        if not selected.indexes():
-            self._current_path = None
-            self._details.clear_details()
-            self._update_inspector_caption(None)
-            self._update_action_state()
+        self._selected_paths_cache = None
+        indexes = selected.indexes()
+        data = self._model.row_data(indexes[0].row()) if indexes else None
+        path = data.get("path") if data else None
+        self._current_path = path if isinstance(path, str) else None
+        # The current path (and so the actions) follows the selection immediately; the
+        # inspector is filled once the selection stops moving.
+        self._pending_details = data if self._current_path else None
+        self._details_timer.start()
+        self._update_action_state()
+
+    def _apply_pending_details(self) -> None:
+        self._show_details(self._pending_details)
+
+    def _flush_pending_details(self) -> None:
+        # The panel acts on the track it shows; catch up with a debounced selection first.
+        if self._details_timer.isActive():
+            self._apply_pending_details()
+
+    def _show_details(self, record: dict[str, Any] | None) -> None:
+        self._details_timer.stop()
+        self._pending_details = record
+        if record is not None and record == self._shown_details:
             return
-        index = selected.indexes()[0]
-        data = self._model.row_data(index.row())
-        if not data:
-            self._current_path = None
+        self._shown_details = record
+        if record is None:
             self._details.clear_details()
             self._update_inspector_caption(None)
-            self._update_action_state()
             return
-        path = data.get("path")
-        self._current_path = path if isinstance(path, str) else None
-        if self._current_path:
-            self._details.show_for_path(self._current_path, record=data)
-            self._update_inspector_caption(data)
-        else:
-            self._details.clear_details()
-            self._update_inspector_caption(None)
-        self._update_action_state()
+        self._details.show_for_path(record.get("path"), record=record)
+        self._update_inspector_caption(record)
 
     # ------------------------------------------------------------------
     # Data loading
@@ -1992,70 +2706,213 @@ class MainWindow(QMainWindow):
     def refresh_results(self) -> None:
         if self._con is None:
             self._model.clear()
-            self._details.clear_details()
+            self._selected_paths_cache = None
+            self._show_details(None)
             self._status.showMessage("Sin conexión a la base de datos")
             return
 
+        # Enter (or any direct call) supersedes a pending debounce tick and any
+        # query still running in the pool.
+        self._search_timer.stop()
+        self._query_seq += 1
+        self._cancel_pending_queries()
+        seq = self._query_seq
         query_text = self._search.text().strip()
-        search_hint = bool(query_text)
-        start = time.perf_counter()
-        try:
-            if query_text:
-                fts_query = fts_query_from_text(query_text)
-                if fts_query is None:
-                    rows: list[sqlite3.Row] = []
-                else:
-                    rows = list(query_tracks(self._con, fts_query=fts_query))
-                    search_hint = False
-            else:
-                rows = list(query_tracks(self._con))
-                search_hint = False
-        except sqlite3.Error as exc:  # pragma: no cover - defensive logging
-            logger.exception("Database query failed: %s", exc)
-            QMessageBox.critical(
-                self,
-                "Error de base de datos",
-                f"No se pudo consultar la base de datos.\n\n{exc}",
-            )
+        fts_query = fts_query_from_text(query_text) if query_text else None
+        if query_text and fts_query is None:
+            self._shown_query_key = (True, None)
+            self._apply_query_results(query_text, ((), {}), 0, 0.0, search_hint=True)
             return
-        elapsed_ms = (time.perf_counter() - start) * 1000.0
 
-        total = len(rows)
-        if total > self.MAX_RESULTS:
-            display_rows = rows[: self.MAX_RESULTS]
-            truncated = True
-        else:
-            display_rows = rows
-            truncated = False
+        tokens = _search_tokens(query_text)
+        cached = self._cached_result(tokens) if tokens is not None else None
+        if tokens is not None and cached is not None:
+            start = time.perf_counter()
+            keys, columns, total = cached.results_for(tokens)
+            elapsed_ms = (time.perf_counter() - start) * 1000.0
+            self._on_query_finished(seq, query_text, (keys, columns), total, elapsed_ms)
+            return
 
-        self._model.set_rows(display_rows)
+        db_path = self._db_path
+        if db_path is None:
+            # In-memory/attached connections cannot be reopened from another thread.
+            start = time.perf_counter()
+            try:
+                keys, columns, total = _fetch_results(self._con, fts_query, self.MAX_RESULTS)
+            except sqlite3.Error as exc:  # pragma: no cover - defensive logging
+                logger.exception("Database query failed: %s", exc)
+                self._on_query_failed(seq, exc)
+                return
+            elapsed_ms = (time.perf_counter() - start) * 1000.0
+            self._on_query_finished(seq, query_text, (keys, columns), total, elapsed_ms)
+            return
 
-        if not self._restore_selection():
-            self._auto_select_first()
+        runnable = _QueryRunnable(db_path, seq, query_text, fts_query, self.MAX_RESULTS)
+        runnable.signals.finished.connect(self._on_query_finished)
+        runnable.signals.failed.connect(self._on_query_failed)
+        self._query_runnables[seq] = runnable
+        QThreadPool.globalInstance().start(runnable)
 
-        shown = len(display_rows)
-        message = self._format_status_message(
-            shown=shown,
-            total=total,
-            truncated=truncated,
-            elapsed_ms=elapsed_ms,
-            search_hint=search_hint,
-        )
-        self._status.showMessage(message)
-        self._update_summary_badge(shown=shown, total=total, truncated=truncated)
-        self._update_table_caption(
-            query_text=query_text,
-            shown=shown,
-            total=total,
-            truncated=truncated,
-            elapsed_ms=elapsed_ms,
+    def _cached_result(self, tokens: tuple[str, ...]) -> _CachedResult | None:
+        """Return the cached result for *tokens*, or the smallest one that holds it.
+
+        An exact repeat is served as stored, even if it was truncated. Otherwise each
+        term of a complete, narrowable cached query must be a prefix of some new term:
+        every row the new query matches then also matched the cached one.
+        """
+
+        if self._scan_signals is not None:
+            # A running scan keeps adding rows that the cached results lack.
+            return None
+        exact = self._result_cache.get(tokens)
+        if exact is not None:
+            self._result_cache.move_to_end(tokens)
+            return exact
+        best: _CachedResult | None = None
+        best_key: tuple[str, ...] | None = None
+        for key, entry in self._result_cache.items():
+            if not entry.complete or (best is not None and len(entry) >= len(best)):
+                continue
+            if (
+                all(any(token.startswith(old) for token in tokens) for old in key)
+                and entry.narrowable
+            ):
+                best, best_key = entry, key
+        if best_key is not None:
+            self._result_cache.move_to_end(best_key)
+        return best
+
+    def _remember_result(
+        self,
+        seq: int,
+        query_text: str,
+        keys: tuple[str, ...],
+        columns: dict[str, list[Any]],
+        total: int,
+    ) -> None:
+        tokens = _search_tokens(query_text)
+        if tokens is None or self._scan_signals is not None or seq < self._result_cache_min_seq:
+            return
+        existing = self._result_cache.get(tokens)
+        if existing is None or existing.columns is not columns:
+            # A repeat served from the cache keeps its entry (and built haystacks).
+            self._result_cache[tokens] = _CachedResult(tokens, keys, columns, total)
+        self._result_cache.move_to_end(tokens)
+        while len(self._result_cache) > self.RESULT_CACHE_SIZE:
+            self._result_cache.popitem(last=False)
+
+    def _invalidate_result_cache(self) -> None:
+        self._result_cache.clear()
+        self._shown_query_key = None
+        self._result_cache_min_seq = self._query_seq + 1
+
+    def _check_search_plan(self) -> None:
+        """Trace SQL and warn when full-text searches no longer use the FTS index."""
+
+        if self._con is None:
+            return
+        self._con.set_trace_callback(_trace_sql)
+        try:
+            plan = explain_tracks_query(
+                self._con, fts_query_from_text("a"), limit=self.MAX_RESULTS
+            )
+        except sqlite3.Error as exc:  # pragma: no cover - defensive logging
+            logger.warning("Cannot explain the search query: %s", exc)
+            return
+        if fts_plan_uses_index(plan):
+            logger.info("Search plan uses the FTS index: %s", "; ".join(plan))
+            return
+        logger.warning("Search plan does not use the FTS index: %s", "; ".join(plan))
+        # A permanent widget, so later status messages do not hide the warning.
+        badge = QLabel("⚠ Búsqueda sin índice FTS", self._status)
+        badge.setToolTip("Las búsquedas recorren la tabla completa; revisa el registro.")
+        self._status.addPermanentWidget(badge)
+
+    def _reload_results(self) -> None:
+        # An explicit refresh must see changes made outside this window (CLI, other
+        # instances), so it bypasses the cached results.
+        self._invalidate_result_cache()
+        self.refresh_results()
+
+    def _cancel_pending_queries(self, *, close_readers: bool = False) -> None:
+        # Entries stay until each runnable reports back through finished/failed.
+        for runnable in self._query_runnables.values():
+            runnable.cancel(close_reader=close_readers)
+
+    def _on_query_finished(
+        self, seq: int, query_text: str, result: object, total: int, elapsed_ms: float
+    ) -> None:
+        self._query_runnables.pop(seq, None)
+        if seq != self._query_seq:
+            # A newer refresh is in flight; its results win.
+            return
+        columns = cast(tuple[tuple[str, ...], dict[str, list[Any]]], result)
+        self._shown_query_key = _query_key(query_text)
+        keys, values = columns
+        self._remember_result(seq, query_text, keys, values, total)
+        self._apply_query_results(query_text, columns, total, elapsed_ms, search_hint=False)
+
+    def _on_query_failed(self, seq: int, error: object) -> None:
+        self._query_runnables.pop(seq, None)
+        if seq != self._query_seq:
+            return
+        QMessageBox.critical(
+            self,
+            "Error de base de datos",
+            f"No se pudo consultar la base de datos.\n\n{error}",
         )
 
-        if shown == 0:
-            self._details.clear_details()
-            self._current_path = None
-            self._update_inspector_caption(None)
-        self._update_action_state()
+    def _apply_query_results(
+        self,
+        query_text: str,
+        result: tuple[tuple[str, ...], dict[str, list[Any]]],
+        total: int,
+        elapsed_ms: float,
+        *,
+        search_hint: bool,
+    ) -> None:
+        keys, columns = result
+        shown = len(columns[keys[0]]) if keys else 0
+        truncated = total > shown
+
+        with self._bulk_update():
+            alternate = shown < self.ALTERNATE_ROWS_LIMIT
+            if self._table.alternatingRowColors() != alternate:
+                self._table.setAlternatingRowColors(alternate)
+            # Row deltas and the reselection can each emit selectionChanged; hold them
+            # back and sync the current path and inspector once from the final selection.
+            selection_model = self._table.selectionModel()
+            blocker = QSignalBlocker(selection_model)
+            try:
+                self._model.set_columns(keys, columns)
+                if not self._restore_selection():
+                    self._auto_select_first()
+            finally:
+                blocker.unblock()
+            # Also covers rows replaced in place, where the same selection now holds
+            # other paths and Qt would not have emitted anything.
+            self._on_selection_changed(selection_model.selection(), QItemSelection())
+
+            message = self._format_status_message(
+                shown=shown,
+                total=total,
+                truncated=truncated,
+                elapsed_ms=elapsed_ms,
+                search_hint=search_hint,
+            )
+            self._status.showMessage(message)
+            self._update_summary_badge(shown=shown, total=total, truncated=truncated)
+            self._update_table_caption(
+                query_text=query_text,
+                shown=shown,
+                total=total,
+                truncated=truncated,
+                elapsed_ms=elapsed_ms,
+            )
+
+            if shown == 0:
+                self._current_path = None
+                self._show_details(None)
 
     def _format_status_message(
         self,
@@ -2083,66 +2940,113 @@ class MainWindow(QMainWindow):
         if row is None:
             self._current_path = None
             return False
+        self._model.ensure_loaded(row)
         self._select_row(row)
         return True
 
     def _auto_select_first(self) -> None:
-        if self._model.rowCount() <= 0:
-            return
-        selection_model = self._table.selectionModel()
-        if selection_model is None:
-            return
-        if selection_model.hasSelection():
-            return
-        self._select_row(0)
+        if self._model.rowCount() > 0:
+            self._select_row(0)
 
     def _select_row(self, row: int) -> None:
-        if row < 0 or row >= self._model.rowCount():
+        self._select_rows([row])
+
+    def _select_rows(self, rows: Iterable[int]) -> None:
+        """Select *rows* with a single ``select()`` call, one range per contiguous run."""
+
+        row_count = self._model.rowCount()
+        valid_rows = sorted({row for row in rows if 0 <= row < row_count})
+        if not valid_rows:
             return
         selection_model = self._table.selectionModel()
         if selection_model is None:
             return
-        index = self._model.index(row, 0)
+        last_column = max(self._model.columnCount() - 1, 0)
+        selection = QItemSelection()
+        for _, run in groupby(enumerate(valid_rows), key=lambda item: item[1] - item[0]):
+            run_rows = [row for _, row in run]
+            selection.select(
+                self._model.index(run_rows[0], 0),
+                self._model.index(run_rows[-1], last_column),
+            )
+        # ``ClearAndSelect`` replaces the old selection atomically; never precede it with
+        # ``clearSelection()``, which would emit an extra ``selectionChanged``.
         selection_model.select(
-            index,
+            selection,
             QItemSelectionModel.ClearAndSelect | QItemSelectionModel.Rows,
         )
-        self._table.scrollTo(index, QAbstractItemView.PositionAtCenter)
+        first_index = self._model.index(valid_rows[0], 0)
+        if not self._table.viewport().rect().contains(self._table.visualRect(first_index)):
+            self._table.scrollTo(first_index, QAbstractItemView.PositionAtCenter)
 
     # ------------------------------------------------------------------
     # Helpers
     # ------------------------------------------------------------------
-    def _selected_paths(self) -> list[Path]:
-        selection_model = self._table.selectionModel()
-        paths: list[Path] = []
-        if selection_model is not None:
-            for index in selection_model.selectedRows():
-                record = self._model.row_data(index.row())
-                path_value = record.get("path") if record else None
-                if isinstance(path_value, str):
-                    paths.append(Path(path_value))
+    @contextmanager
+    def _bulk_update(self) -> Iterator[None]:
+        """Suspend table repaints while a result is applied; update actions once at the end."""
+
+        self._table.setUpdatesEnabled(False)
+        try:
+            yield
+        finally:
+            self._table.setUpdatesEnabled(True)
+            self._update_action_state()
+
+    def _selected_paths(self) -> Sequence[str]:
+        """Return the selected paths as stored in the model; callers must not mutate it.
+
+        Plain strings: only open/reveal need a ``Path``, and only for the first entry.
+        """
+
+        paths = self._selected_paths_cache
+        if paths is None:
+            paths = self._selected_paths_cache = self._collect_selected_paths()
         if not paths and self._current_path:
-            paths.append(Path(self._current_path))
+            return (self._current_path,)
+        return paths
+
+    def _primary_selected_path(self) -> str | None:
+        # The current path is the track the inspector shows; the selection walk is only
+        # needed when it was cleared while other rows stayed selected.
+        if self._current_path:
+            return self._current_path
+        paths = self._selected_paths()
+        return paths[0] if paths else None
+
+    def _collect_selected_paths(self) -> list[str]:
+        selection_model = self._table.selectionModel()
+        paths: list[str] = []
+        # hasSelection() avoids copying an empty QItemSelection out of Qt.
+        if selection_model is not None and selection_model.hasSelection():
+            snapshot = self._model.paths_snapshot()
+            limit = len(snapshot)
+            # Walk the selection ranges instead of ``selectedRows()`` so a large
+            # selection does not allocate one QModelIndex wrapper per row.
+            rows = sorted(
+                {
+                    row
+                    for sel_range in selection_model.selection()
+                    for row in range(sel_range.top(), min(sel_range.bottom() + 1, limit))
+                }
+            )
+            paths = [p for p in (snapshot[r] for r in rows) if p]
         return paths
 
     def _reveal_in_file_manager(self, path: Path) -> None:
-        target = path if path.exists() else path.parent
-        if target is None or not target.exists():
-            target = Path.home()
+        # A single stat() answers exists/is_dir/is_file; slow on network drives otherwise.
         try:
-            if _is_macos():
-                if path.is_dir():
-                    subprocess.Popen(["open", str(target)])
-                else:
-                    subprocess.Popen(["open", "-R", str(path)])
-            elif _is_windows():
-                if path.exists() and path.is_file():
-                    subprocess.Popen(["explorer", "/select,", str(path)])
-                else:
-                    subprocess.Popen(["explorer", str(target)])
-            else:
-                launch_target = path if path.is_dir() else target
-                subprocess.Popen(["xdg-open", str(launch_target)])
+            mode: int | None = path.stat().st_mode
+        except OSError:
+            mode = None
+        if mode is not None:
+            target = path
+        else:
+            target = path.parent if path.parent.exists() else Path.home()
+        is_dir = mode is not None and stat.S_ISDIR(mode)
+        is_file = mode is not None and stat.S_ISREG(mode)
+        try:
+            _REVEAL_IMPL(path, target, is_dir, is_file)
         except Exception as exc:  # noqa: BLE001 - show UI feedback
             QMessageBox.critical(
                 self,
@@ -2151,115 +3055,147 @@ class MainWindow(QMainWindow):
             )
 
     def _update_action_state(self) -> None:
+        model = self._model
+        row_count = model.rowCount() if model is not None else 0
+        has_rows = row_count > 0
         has_selection = bool(self._current_path)
-        has_rows = self._model.rowCount() > 0 if self._model is not None else False
         search_has_text = bool(self._search.text())
         has_plan = bool(self._organizer_plan)
-        enable_enrich = has_selection and self._can_enrich_metadata
-        enrich_hint = (
-            self._enrich_disabled_reason or "Configura las APIs para habilitar el enriquecimiento."
+        db_available = self._con is not None
+        state = (
+            has_selection,
+            has_rows,
+            search_has_text,
+            has_plan,
+            db_available,
+            self._can_enrich_metadata,
+            self._can_generate_spectrum,
+            self._enrich_disabled_reason,
+            self._spectrum_disabled_reason,
         )
-        enable_spectrum = has_selection and self._can_generate_spectrum
-        spectrum_hint = self._spectrum_disabled_reason or "Instala ffmpeg para generar espectros."
-        simulate_available = self._con is not None
-        plan_hint = "Genera un plan con «Simular biblioteca» para habilitar esta acción."
-
-        if self._btn_simulate is not None:
-            self._btn_simulate.setEnabled(simulate_available)
-            self._btn_simulate.setToolTip(
-                ""
-                if simulate_available
-                else "Conecta una base de datos para simular la biblioteca."
-            )
-        if self._action_simulate is not None:
-            self._action_simulate.setEnabled(simulate_available)
-            simulate_tip = (
-                "Genera un plan de organización sin aplicar cambios."
-                if simulate_available
-                else "Conecta una base de datos para simular la biblioteca."
-            )
-            self._action_simulate.setStatusTip(simulate_tip)
-
-        if self._btn_apply_plan is not None:
-            self._btn_apply_plan.setEnabled(has_plan)
-            self._btn_apply_plan.setToolTip("" if has_plan else plan_hint)
-        if self._action_apply_plan is not None:
-            self._action_apply_plan.setEnabled(has_plan)
-            apply_tip = "Aplica el último plan de organización generado." if has_plan else plan_hint
-            self._action_apply_plan.setStatusTip(apply_tip)
-
-        if self._btn_enrich is not None:
-            self._btn_enrich.setEnabled(enable_enrich)
-            self._btn_enrich.setToolTip("" if enable_enrich else enrich_hint)
-        if self._action_enrich is not None:
-            self._action_enrich.setEnabled(enable_enrich)
-            self._action_enrich.setStatusTip(
-                self._action_enrich_default_tip if enable_enrich else enrich_hint
-            )
+        if state == self._last_action_state:
+            return
+        self._last_action_state = state
 
-        if self._btn_spectrum is not None:
-            self._btn_spectrum.setEnabled(enable_spectrum)
-            self._btn_spectrum.setToolTip("" if enable_spectrum else spectrum_hint)
-        if self._action_spectrum is not None:
-            self._action_spectrum.setEnabled(enable_spectrum)
-            self._action_spectrum.setStatusTip(
-                self._action_spectrum_default_tip if enable_spectrum else spectrum_hint
-            )
+        enable_enrich = has_selection and self._can_enrich_metadata
+        enable_spectrum = has_selection and self._can_generate_spectrum
+        simulate_available = db_available
+        apply = self._apply_target_state
 
-        if self._action_open_track is not None:
-            self._action_open_track.setEnabled(has_selection)
-        if self._action_reveal_track is not None:
-            self._action_reveal_track.setEnabled(has_selection)
-        if self._action_copy_paths is not None:
-            self._action_copy_paths.setEnabled(has_selection)
+        apply(
+            self._btn_simulate,
+            enabled=simulate_available,
+            tool_tip="" if simulate_available else self._SIMULATE_DISABLED_TIP,
+        )
+        apply(
+            self._action_simulate,
+            enabled=simulate_available,
+            status_tip=(
+                self._SIMULATE_TIP if simulate_available else self._SIMULATE_DISABLED_TIP
+            ),
+        )
 
-        if self._action_clear_search is not None:
-            self._action_clear_search.setEnabled(search_has_text)
+        apply(
+            self._btn_apply_plan,
+            enabled=has_plan,
+            tool_tip="" if has_plan else self._PLAN_HINT,
+        )
+        apply(
+            self._action_apply_plan,
+            enabled=has_plan,
+            status_tip=self._APPLY_PLAN_TIP if has_plan else self._PLAN_HINT,
+        )
 
-        if self._action_select_all is not None:
-            self._action_select_all.setEnabled(has_rows)
+        if enable_enrich:
+            apply(self._btn_enrich, enabled=True, tool_tip="")
+            apply(self._action_enrich, enabled=True, status_tip=self._action_enrich_default_tip)
+        else:
+            enrich_hint = self._enrich_disabled_reason or self._ENRICH_DEFAULT_HINT
+            apply(self._btn_enrich, enabled=False, tool_tip=enrich_hint)
+            apply(self._action_enrich, enabled=False, status_tip=enrich_hint)
+
+        if enable_spectrum:
+            apply(self._btn_spectrum, enabled=True, tool_tip="")
+            apply(
+                self._action_spectrum, enabled=True, status_tip=self._action_spectrum_default_tip
+            )
+        else:
+            spectrum_hint = self._spectrum_disabled_reason or self._SPECTRUM_DEFAULT_HINT
+            apply(self._btn_spectrum, enabled=False, tool_tip=spectrum_hint)
+            apply(self._action_spectrum, enabled=False, status_tip=spectrum_hint)
 
-        if self._action_refresh is not None:
-            self._action_refresh.setEnabled(self._con is not None)
+        apply(
+            self._action_open_track,
+            enabled=has_selection,
+            status_tip=self._OPEN_TIP if has_selection else self._OPEN_DISABLED_TIP,
+        )
+        apply(
+            self._action_reveal_track,
+            enabled=has_selection,
+            status_tip=self._REVEAL_TIP if has_selection else self._REVEAL_DISABLED_TIP,
+        )
+        apply(
+            self._action_copy_paths,
+            enabled=has_selection,
+            status_tip=(
+                self._action_copy_default_tip if has_selection else self._COPY_DISABLED_TIP
+            ),
+        )
 
-        if self._action_focus_search is not None:
-            self._action_focus_search.setEnabled(True)
+        apply(self._action_clear_search, enabled=search_has_text)
+        apply(self._action_select_all, enabled=has_rows)
+        apply(self._action_refresh, enabled=db_available)
+        apply(self._action_focus_search, enabled=True)
 
-        open_tip = "Abrir la pista seleccionada con la aplicación predeterminada del sistema."
-        reveal_tip = "Abrir el explorador de archivos en la ubicación de la pista seleccionada."
-        copy_disabled_tip = "Selecciona al menos una pista para copiar su ruta."
+    def _apply_target_state(
+        self,
+        target: QAction | QWidget | None,
+        *,
+        enabled: bool,
+        tool_tip: str | None = None,
+        status_tip: str | None = None,
+    ) -> None:
+        """Apply *enabled*/tooltips to *target*, skipping writes that would be no-ops."""
 
-        if self._action_open_track is not None:
-            self._action_open_track.setStatusTip(
-                open_tip if has_selection else "Selecciona una pista para poder abrirla."
-            )
-        if self._action_reveal_track is not None:
-            self._action_reveal_track.setStatusTip(
-                reveal_tip
-                if has_selection
-                else "Selecciona una pista para mostrarla en la carpeta."
-            )
-        if self._action_copy_paths is not None:
-            self._action_copy_paths.setStatusTip(
-                self._action_copy_default_tip if has_selection else copy_disabled_tip
-            )
+        if target is None:
+            return
+        state = (enabled, tool_tip, status_tip)
+        key = id(target)
+        if self._action_state_cache.get(key) == state:
+            return
+        self._action_state_cache[key] = state
+        # Widgets attached to a QAction refresh through ActionChanged events, so the
+        # intermediate ``changed()`` emissions of each setter can be suppressed.
+        blocker = QSignalBlocker(target) if isinstance(target, QAction) else None
+        try:
+            target.setEnabled(enabled)
+            if tool_tip is not None:
+                target.setToolTip(tool_tip)
+            if status_tip is not None:
+                target.setStatusTip(status_tip)
+        finally:
+            if blocker is not None:
+                blocker.unblock()
 
     def _resolve_db_path(self, con: sqlite3.Connection | None) -> Path | None:
         if con is None:
             return None
+        key = id(con)
+        if key in self._db_path_cache:
+            return self._db_path_cache[key]
         try:
             row = con.execute("PRAGMA database_list").fetchone()
         except Exception:  # pragma: no cover - defensive
             return None
-        if not row:
-            return None
-        path_str = row[2]
-        if not path_str:
-            return None
-        try:
-            return Path(path_str)
-        except Exception:  # pragma: no cover - fallback for exotic paths
-            return None
+        resolved: Path | None = None
+        path_str = row[2] if row else None
+        if path_str:
+            try:
+                resolved = Path(path_str)
+            except Exception:  # pragma: no cover - fallback for exotic paths
+                resolved = None
+        self._db_path_cache[key] = resolved
+        return resolved
 
     # ------------------------------------------------------------------
     # Qt overrides
@@ -2267,6 +3203,18 @@ class MainWindow(QMainWindow):
     def closeEvent(  # noqa: N802
         self, event: QCloseEvent
     ) -> None:  # pragma: no cover - UI callback
+        self._query_seq += 1  # ignore queries still running in the pool
+        # Running queries close their own reader once interrupted; a scan stops after
+        # the file it is on, so the wait below is normally short.
+        self._cancel_pending_queries(close_readers=True)
+        if self._scan_stop is not None:
+            self._scan_stop.set()
+        pool_idle = QThreadPool.globalInstance().waitForDone(_POOL_SHUTDOWN_WAIT_MS)
+        if pool_idle and self._db_path is not None:
+            # No pool thread is using a reader now, so they can be closed from here.
+            _close_reader_connections(self._db_path)
+        if self._con is not None:
+            self._db_path_cache.pop(id(self._con), None)
         if self._owns_connection and self._con is not None:
             try:
                 self._con.close()
@@ -214,7 +214,8 @@ QFrame#DetailsActions {
 /* Table */
 QTableView {
     background-color: transparent;
-    alternate-background-color: rgba(30, 38, 63, 140);
+    /* rgba(30, 38, 63, 140) pre-blended over the card so striped rows are flat fills. */
+    alternate-background-color: #191f34;
     gridline-color: rgba(46, 60, 100, 160);
     selection-background-color: rgba(80, 120, 230, 200);
     selection-color: #f5f8ff;
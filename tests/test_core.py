@@ -1,11 +1,19 @@
 from __future__ import annotations
 
+import sqlite3
 import wave
 from pathlib import Path
 from typing import Any
 
+import pytest
+
 from songsearch.core.db import (
+    FTS_ROWID_SCHEMA_VERSION,
     connect,
+    connect_readonly,
+    count_tracks,
+    explain_tracks_query,
+    fts_plan_uses_index,
     fts_query_from_text,
     init_db,
     query_tracks,
@@ -36,6 +44,36 @@ def test_scan_and_simulate(tmp_path: Path) -> None:
     assert len(plan) == 1
 
 
+def test_scan_commits_in_batches_and_counts_writes(tmp_path: Path) -> None:
+    db_path = init_db(tmp_path)
+    con = connect(db_path)
+    for idx in range(3):
+        _create_wav(tmp_path / f"track-{idx}.wav")
+
+    assert scan_path(con, tmp_path, batch_size=2) == 3
+    assert not con.in_transaction
+    assert len(query_tracks(connect(db_path))) == 3
+    assert scan_path(con, tmp_path, batch_size=2) == 0
+
+
+def test_scan_rolls_back_a_file_whose_write_fails(monkeypatch, tmp_path: Path) -> None:
+    db_path = init_db(tmp_path)
+    con = connect(db_path)
+    for idx in range(3):
+        _create_wav(tmp_path / f"track-{idx}.wav")
+
+    def _failing_upsert(con, data, *, commit=True):
+        upsert_track(con, data, commit=commit)
+        if data["path"].endswith("track-1.wav"):
+            raise sqlite3.OperationalError("fts write failed")
+
+    monkeypatch.setattr("songsearch.core.scanner.upsert_track", _failing_upsert)
+    assert scan_path(con, tmp_path) == 2
+    paths = sorted(Path(row["path"]).name for row in query_tracks(connect(db_path)))
+    assert paths == ["track-0.wav", "track-2.wav"]
+    assert con.execute("SELECT COUNT(*) FROM tracks_fts").fetchone()[0] == 2
+
+
 def test_simulate_mb_release_fallback_uses_tags(tmp_path: Path) -> None:
     db_path = init_db(tmp_path)
     con = connect(db_path)
@@ -142,6 +180,87 @@ def test_query_tracks_full_text(tmp_path: Path) -> None:
     assert _search_paths("demo") == {str(track3)}
 
 
+def test_fts_query_neutralises_operators(tmp_path: Path) -> None:
+    db_path = init_db(tmp_path)
+    con = connect(db_path)
+    track = str(tmp_path / "a.mp3")
+    upsert_track(con, {"path": track, "title": "Rock AND Roll", "genre": "Or"})
+    upsert_track(con, {"path": track, "title": "Rock AND Roll NOT", "genre": "Or"})
+
+    fts = fts_query_from_text("and OR not")
+    assert fts == '"and"* "OR"* "not"*'
+    rows = query_tracks(con, fts_query=fts)
+    assert [row["path"] for row in rows] == [track]
+    fts_rowids = {r[0] for r in con.execute("SELECT rowid FROM tracks_fts")}
+    assert fts_rowids == {r[0] for r in con.execute("SELECT id FROM tracks")}
+
+
+def test_full_text_ignores_diacritics(tmp_path: Path) -> None:
+    db_path = init_db(tmp_path)
+    con = connect(db_path)
+    con.execute("DROP TABLE tracks_fts")
+    con.execute("CREATE VIRTUAL TABLE tracks_fts USING fts5(title, artist, album, genre, path)")
+    con.commit()
+    upsert_track(con, {"path": str(tmp_path / "a.mp3"), "title": "Canción", "genre": "Género"})
+    con.close()
+
+    con = connect(init_db(tmp_path))
+    for text in ("cancion", "CANCIÓN", "genero"):
+        rows = query_tracks(con, fts_query=fts_query_from_text(text))
+        assert [row["title"] for row in rows] == ["Canción"]
+
+
+def test_fts_rowid_repair_runs_once(tmp_path: Path) -> None:
+    db_path = init_db(tmp_path)
+    con = connect(db_path)
+    upsert_track(con, {"path": str(tmp_path / "a.mp3"), "title": "Uno"})
+    con.execute("UPDATE tracks_fts SET rowid = rowid + 100")
+    con.execute("PRAGMA user_version = 0")
+    con.commit()
+    con.close()
+
+    con = connect(init_db(tmp_path))
+    assert con.execute("PRAGMA user_version").fetchone()[0] == FTS_ROWID_SCHEMA_VERSION
+    fts_rowids = {r[0] for r in con.execute("SELECT rowid FROM tracks_fts")}
+    assert fts_rowids == {r[0] for r in con.execute("SELECT id FROM tracks")}
+
+    # Once the database is marked synced, drift is no longer looked for at startup.
+    con.execute("UPDATE tracks_fts SET rowid = rowid + 100")
+    con.commit()
+    con.close()
+    con = connect(init_db(tmp_path))
+    fts_rowids = {r[0] for r in con.execute("SELECT rowid FROM tracks_fts")}
+    assert fts_rowids != {r[0] for r in con.execute("SELECT id FROM tracks")}
+
+
+def test_query_tracks_limit_and_count(tmp_path: Path) -> None:
+    db_path = init_db(tmp_path)
+    con = connect(db_path)
+    for idx in range(5):
+        upsert_track(con, {"path": str(tmp_path / f"{idx}.mp3"), "title": f"Song {idx}"})
+
+    fts = fts_query_from_text("song")
+    assert len(query_tracks(con, fts_query=fts, limit=3)) == 3
+    assert count_tracks(con, fts_query=fts) == 5
+    assert count_tracks(con, fts_query=fts_query_from_text("missing")) == 0
+
+
+def test_connect_readonly_reads_but_rejects_writes(tmp_path: Path) -> None:
+    db_path = init_db(tmp_path)
+    con = connect(db_path)
+    upsert_track(con, {"path": str(tmp_path / "a.mp3"), "title": "Alpha"})
+    con.close()
+
+    reader = connect_readonly(db_path)
+    try:
+        rows = query_tracks(reader, fts_query=fts_query_from_text("alp"))
+        assert [row["title"] for row in rows] == ["Alpha"]
+        with pytest.raises(sqlite3.OperationalError):
+            reader.execute("DELETE FROM tracks")
+    finally:
+        reader.close()
+
+
 def test_scan_skips_files_with_same_stat(monkeypatch, tmp_path: Path) -> None:
     db_path = init_db(tmp_path)
     con = connect(db_path)
@@ -260,3 +379,37 @@ def test_enrich_uses_cached_payload(monkeypatch, tmp_path: Path) -> None:
     assert second is not None
     assert second["title"] == "Test Title"
     assert calls["acoustid"] == 1
+
+
+def test_search_plan_uses_fts_index(tmp_path: Path) -> None:
+    con = connect(init_db(tmp_path))
+
+    plan = explain_tracks_query(con, fts_query_from_text("song"), limit=10)
+    assert fts_plan_uses_index(plan)
+    assert not fts_plan_uses_index(explain_tracks_query(con))
+
+
+@pytest.mark.parametrize(
+    ("plan", "expected"),
+    [
+        (
+            [
+                "SCAN tracks_fts VIRTUAL TABLE INDEX 0:M5",
+                "SEARCH tracks USING INTEGER PRIMARY KEY (rowid=?)",
+            ],
+            True,
+        ),
+        (
+            [
+                "SCAN TABLE tracks_fts VIRTUAL TABLE INDEX 0:M5",
+                "SEARCH TABLE tracks USING INTEGER PRIMARY KEY (rowid=?)",
+            ],
+            True,
+        ),
+        (["SCAN tracks", "USE TEMP B-TREE FOR ORDER BY"], False),
+        (["SCAN TABLE tracks", "USE TEMP B-TREE FOR ORDER BY"], False),
+        (["SCAN TABLE tracks_fts VIRTUAL TABLE INDEX 0:M5", "SCAN TABLE tracks"], False),
+    ],
+)
+def test_fts_plan_check_accepts_old_and_new_wording(plan: list[str], expected: bool) -> None:
+    assert fts_plan_uses_index(plan) is expected
@@ -0,0 +1,176 @@
+from __future__ import annotations
+
+import os
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+import pytest
+
+pytest.importorskip(
+    "PySide6.QtWidgets",
+    reason="PySide6 no está disponible o falta libGL.so.1 en el entorno de ejecución",
+    exc_type=ImportError,
+)
+
+from PySide6.QtCore import Qt
+
+from songsearch.core.db import connect, fts_query_from_text, init_db, query_tracks, upsert_track
+from songsearch.ui.main_window import (
+    TrackTableModel,
+    _CachedResult,
+    _rows_to_columns,
+    _search_tokens,
+)
+
+
+@pytest.fixture
+def model():
+    return TrackTableModel()
+
+
+def _rows():
+    return [
+        {
+            "title": "Uno",
+            "artist": "Artista",
+            "album": "Disco",
+            "genre": "Rock",
+            "year": 1999,
+            "duration": 125.4,
+            "bitrate": 320000,
+            "format": "mp3",
+            "path": "/music/uno.mp3",
+        },
+        {
+            "title": None,
+            "artist": "Otro",
+            "album": "",
+            "genre": None,
+            "year": None,
+            "duration": None,
+            "bitrate": 192,
+            "format": "flac",
+            "path": "/music/dos.flac",
+        },
+    ]
+
+
+def _column(key: str) -> int:
+    return [k for k, _ in TrackTableModel.COLUMNS].index(key)
+
+
+def test_display_strings_are_formatted(model):
+    model.set_rows(_rows())
+
+    assert model.rowCount() == 2
+    assert model.data(model.index(0, _column("duration"))) == "2:05"
+    assert model.data(model.index(0, _column("bitrate"))) == "320 kbps"
+    assert model.data(model.index(1, _column("bitrate"))) == "192 kbps"
+    assert model.data(model.index(1, _column("title"))) == "—"
+    assert model.data(model.index(1, _column("album"))) == "—"
+
+
+def test_alignment_only_for_numeric_columns(model):
+    model.set_rows(_rows())
+
+    right = int(Qt.AlignRight | Qt.AlignVCenter)
+    assert model.data(model.index(0, _column("year")), Qt.TextAlignmentRole) == right
+    assert model.data(model.index(0, _column("title")), Qt.TextAlignmentRole) is None
+    assert model.data(model.index(0, _column("title")), Qt.ToolTipRole) is None
+
+
+def test_index_for_path_and_row_data(model):
+    model.set_rows(_rows())
+
+    assert model.index_for_path("/music/dos.flac") == 1
+    assert model.index_for_path("/music/missing.mp3") is None
+    assert model.index_for_path(None) is None
+    assert model.row_data(0)["title"] == "Uno"
+    assert model.row_data(5) is None
+
+    model.clear()
+    assert model.rowCount() == 0
+    assert model.index_for_path("/music/uno.mp3") is None
+
+
+def test_set_rows_updates_in_place_without_reset(model):
+    resets: list[str] = []
+    model.modelReset.connect(lambda: resets.append("reset"))
+
+    model.set_rows(_rows())
+    model.set_rows(_rows()[1:])
+    assert model.rowCount() == 1
+    assert model.index_for_path("/music/dos.flac") == 0
+    assert model.data(model.index(0, _column("format"))) == "flac"
+
+    model.set_rows(list(reversed(_rows())))
+    assert model.rowCount() == 2
+    assert model.index_for_path("/music/uno.mp3") == 1
+    assert resets == []
+
+
+def test_rows_are_exposed_in_pages(model):
+    page = TrackTableModel.FETCH_PAGE
+    rows = [{"title": f"T{idx}", "path": f"/music/{idx}.mp3"} for idx in range(page * 2 + 5)]
+    model.set_rows(rows)
+
+    root = model.index(-1, -1)
+    assert model.rowCount() == page
+    assert model.total_rows() == len(rows)
+    assert model.canFetchMore(root)
+
+    model.fetchMore(root)
+    assert model.rowCount() == page * 2
+    assert model.data(model.index(page * 2 - 1, _column("title"))) == f"T{page * 2 - 1}"
+
+    row = model.index_for_path(f"/music/{len(rows) - 1}.mp3")
+    model.ensure_loaded(row)
+    assert model.rowCount() == len(rows)
+    assert not model.canFetchMore(root)
+
+
+def test_cached_result_narrows_like_prefix_search():
+    keys = ("title", "artist", "path")
+    columns = {
+        "title": ["Canción", "Under Pressure", None],
+        "artist": ["Niño", "Queen", "Queen"],
+        "path": ["/m/a.mp3", "/m/b.mp3", "/m/demo_track.flac"],
+    }
+    cached = _CachedResult(("q",), keys, columns, 3)
+
+    assert _search_tokens("CANCIÓN") == ("cancion",)
+    assert _search_tokens("foo_bar") is None
+    assert _search_tokens("Σί") is None
+    assert cached.narrow(("cancion",))[1]["path"] == ["/m/a.mp3"]
+    assert cached.narrow(("quee",))[1]["path"] == ["/m/b.mp3", "/m/demo_track.flac"]
+    assert cached.narrow(("quee", "pres"))[1]["title"] == ["Under Pressure"]
+    assert cached.narrow(("ueen",))[1]["path"] == []
+    assert cached.narrow(("track",))[1]["path"] == ["/m/demo_track.flac"]
+    assert cached.complete
+    assert cached.results_for(("q",)) == (keys, columns, 3)
+    assert cached.results_for(("under",))[2] == 1
+
+
+@pytest.mark.parametrize(
+    ("titles", "queries", "narrowable"),
+    [
+        (["Canción", "Niño", "Æther", "Über"], ["cancion", "niño", "NINO", "æth", "ub"], True),
+        (["Σίσυφος", "Σοφία"], ["σισ", "Σί", "σοφ"], False),
+        (["Kunſt", "Kunst"], ["s", "kuns"], False),
+        (["µ-Ziq", "Ziq"], ["µ", "ziq"], False),
+    ],
+)
+def test_cached_narrowing_matches_fts(tmp_path, titles, queries, narrowable):
+    con = connect(init_db(tmp_path))
+    for idx, title in enumerate(titles):
+        upsert_track(con, {"path": f"/m/{idx}.mp3", "title": title})
+    keys, columns = _rows_to_columns(query_tracks(con))
+    cached = _CachedResult((), keys, columns, len(titles))
+
+    # Rows the Python folding cannot mirror send every narrower search to SQL.
+    assert cached.narrowable is narrowable
+    for query in queries:
+        expected = [row["path"] for row in query_tracks(con, fts_query=fts_query_from_text(query))]
+        tokens = _search_tokens(query)
+        if tokens is not None and narrowable:
+            assert cached.narrow(tokens)[1]["path"] == expected, query